@@ -1,18 +1,14 @@
 import sys
 import os
-from pathlib import Path
 
 # Set up the script directory and ensure it's in sys.path
-script_directory = Path(__file__).resolve().parent
-if str(script_directory) not in sys.path:
-    sys.path.append(str(script_directory))
-
-from dotenv import load_dotenv
-
-from src.secrets import setup_secrets
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.append(SCRIPT_DIR)
 
 import argparse
-import uvicorn
+
+SYSTEM_CA_BUNDLE = "/etc/ssl/certs/ca-certificates.crt"
 
 # Import AFTER env is loaded
 
@@ -26,11 +22,15 @@ if __name__ == "__main__":
 
     # If secrets are delivered via environment variables (Cloud Run), materialize them.
     if os.getenv("ENV_FILE") or os.getenv("SERVICE_ACCOUNT_KEY"):
+        from src.secrets import setup_secrets
+
         setup_secrets(args.env)
 
     # Load .env relative to this script so it works regardless of CWD
-    env_path=script_directory / "secrets" / f"env.{args.env}"
-    if env_path.exists():
+    env_path = os.path.join(SCRIPT_DIR, "secrets", f"env.{args.env}")
+    if os.path.isfile(env_path):
+        from dotenv import load_dotenv
+
         load_dotenv(env_path, override=True)
     else:
         raise FileNotFoundError(f"Could not find an environment file for '{args.env}'. ")
@@ -41,16 +41,23 @@ if __name__ == "__main__":
      
 
     # Ensure TLS trust store is available for Cloud SQL connector / aiohttp
-    if not os.getenv("SSL_CERT_FILE") or not os.path.exists(os.getenv("SSL_CERT_FILE", "")):
-        try:
-            import certifi  # type: ignore
-
-            cert_path = certifi.where()
-            os.environ.setdefault("SSL_CERT_FILE", cert_path)
+    # Prefer the system bundle so certifi is only imported when no CA file exists on disk.
+    ssl_cert_file = os.getenv("SSL_CERT_FILE", "")
+    if not ssl_cert_file or not os.path.exists(ssl_cert_file):
+        cert_path = SYSTEM_CA_BUNDLE if os.path.exists(SYSTEM_CA_BUNDLE) else ""
+        if not cert_path:
+            try:
+                import certifi  # type: ignore
+
+                cert_path = certifi.where()
+            except Exception:
+                pass
+        if cert_path:
+            os.environ["SSL_CERT_FILE"] = cert_path
             os.environ.setdefault("REQUESTS_CA_BUNDLE", cert_path)
-        except Exception:
-            pass
 
     #This is the last thing to do because first we need the secrets imported
     from app import app
+    import uvicorn
+
     uvicorn.run(app, host="0.0.0.0", port=args.port)
@@ -11,6 +11,9 @@ depends_on = None
 
 
 def upgrade() -> None:
+    # Bulk copy without per-row fsync/WAL; the table is switched to LOGGED once filled.
+    op.execute("SET LOCAL synchronous_commit = off")
+    op.execute("SET LOCAL maintenance_work_mem = '512MB'")
     op.create_table(
         "user_api_key_new",
         sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
@@ -27,10 +30,10 @@ def upgrade() -> None:
         ),
         sa.Column("last_used_at", sa.TIMESTAMP(timezone=False), nullable=True),
         sa.ForeignKeyConstraint(["user_id"], ["app_user.id"], ondelete="CASCADE"),
-        sa.UniqueConstraint("key_hash", name="uq_user_api_key_hash"),
-        sa.UniqueConstraint("user_id", "key_prefix", name="ux_user_api_key_user_prefix"),
+        prefixes=["UNLOGGED"],
     )
 
+    # Unique constraints are built after the copy in one sorted pass.
     op.execute(
         """
         INSERT INTO user_api_key_new (user_id, key_hash, key_prefix, label, storage_uid, created_at, last_used_at)
@@ -39,9 +42,12 @@ def upgrade() -> None:
         """
     )
 
+    op.execute("ALTER TABLE user_api_key_new SET LOGGED")
     op.drop_table("user_api_key")
     op.rename_table("user_api_key_new", "user_api_key")
 
+    op.create_unique_constraint("uq_user_api_key_hash", "user_api_key", ["key_hash"])
+    op.create_unique_constraint("ux_user_api_key_user_prefix", "user_api_key", ["user_id", "key_prefix"])
     op.create_index("ix_user_api_key_storage_uid", "user_api_key", ["storage_uid"], unique=False)
     op.create_index("ix_user_api_key_user", "user_api_key", ["user_id"], unique=False)
 
@@ -65,9 +71,9 @@ def downgrade() -> None:
         sa.Column("last_used_at", sa.TIMESTAMP(timezone=False), nullable=True),
         sa.ForeignKeyConstraint(["user_id"], ["app_user.id"], ondelete="CASCADE"),
         sa.PrimaryKeyConstraint("user_id"),
-        sa.UniqueConstraint("key_hash", name="uq_user_api_key_hash"),
     )
 
+    op.execute("SET LOCAL synchronous_commit = off")
     op.execute(
         """
         INSERT INTO user_api_key_old (user_id, key_hash, key_prefix, storage_uid, created_at, last_used_at)
@@ -84,4 +90,5 @@ def downgrade() -> None:
     op.drop_table("user_api_key")
     op.rename_table("user_api_key_old", "user_api_key")
 
+    op.create_unique_constraint("uq_user_api_key_hash", "user_api_key", ["key_hash"])
     op.create_index("ix_user_api_key_storage_uid", "user_api_key", ["storage_uid"], unique=False)
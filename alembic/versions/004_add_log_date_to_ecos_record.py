@@ -9,6 +9,8 @@ down_revision = "003_multi_user_api_keys"
 branch_labels = None
 depends_on = None
 
+BACKFILL_BATCH_SIZE = 50000
+
 
 def upgrade() -> None:
     op.add_column(
@@ -16,8 +18,32 @@ def upgrade() -> None:
         sa.Column("log_date", sa.Date(), nullable=True),
         schema="app",
     )
+    # Set the default before backfilling so rows inserted meanwhile already carry a value.
+    op.alter_column(
+        "ecos_record",
+        "log_date",
+        schema="app",
+        existing_type=sa.Date(),
+        server_default=sa.text("CURRENT_DATE"),
+    )
 
-    op.execute("UPDATE app.ecos_record SET log_date = date")
+    # Backfill in short, separately committed id ranges instead of one table-wide UPDATE.
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        min_id, max_id = bind.execute(sa.text("SELECT MIN(id), MAX(id) FROM app.ecos_record")).one()
+        if min_id is not None:
+            for start_id in range(min_id, max_id + 1, BACKFILL_BATCH_SIZE):
+                bind.execute(
+                    sa.text(
+                        """
+                        UPDATE app.ecos_record
+                        SET log_date = date
+                        WHERE id BETWEEN :start_id AND :end_id
+                          AND log_date IS NULL
+                        """
+                    ),
+                    {"start_id": start_id, "end_id": start_id + BACKFILL_BATCH_SIZE - 1},
+                )
 
     op.alter_column(
         "ecos_record",
@@ -25,7 +51,6 @@ def upgrade() -> None:
         schema="app",
         existing_type=sa.Date(),
         nullable=False,
-        server_default=sa.text("CURRENT_DATE"),
     )
 
     op.create_index(
@@ -18,14 +18,20 @@ def upgrade():
     # First, delete duplicate rows keeping only one per unique combination
     op.execute(
         """
-        DELETE FROM app.radiologist_assignments a
-        USING app.radiologist_assignments b
-        WHERE a.ctid < b.ctid
-          AND a.date = b.date
-          AND a.technician_id = b.technician_id
-          AND a.center_id IS NOT DISTINCT FROM b.center_id
-          AND a.echo_type = b.echo_type
-          AND a.reporting_radiologist_id = b.reporting_radiologist_id
+        DELETE FROM app.radiologist_assignments
+        WHERE ctid IN (
+            SELECT ctid
+            FROM (
+                SELECT
+                    ctid,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY date, technician_id, center_id, echo_type, reporting_radiologist_id
+                        ORDER BY ctid DESC
+                    ) AS rn
+                FROM app.radiologist_assignments
+            ) ranked
+            WHERE ranked.rn > 1
+        )
         """
     )
     
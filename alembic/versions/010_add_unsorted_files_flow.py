@@ -6,12 +6,33 @@ Create Date: 2026-02-18
 """
 
 from alembic import op
+from sqlalchemy import text
 
 revision = "010_add_unsorted_files_flow"
 down_revision = "009_add_card_article_scope"
 branch_labels = None
 depends_on = None
 
+_UNSORTED_FILE_LATE_COLUMNS = ("original_path", "origin_text", "mime_type", "updated_at")
+
+
+def _missing_unsorted_file_columns(bind):
+    existing = set(
+        bind.execute(
+            text(
+                """
+                SELECT column_name
+                FROM information_schema.columns
+                WHERE table_schema = 'app'
+                  AND table_name = 'unsorted_files'
+                  AND column_name = ANY(:column_names)
+                """
+            ),
+            {"column_names": list(_UNSORTED_FILE_LATE_COLUMNS)},
+        ).scalars()
+    )
+    return [column for column in _UNSORTED_FILE_LATE_COLUMNS if column not in existing]
+
 
 def upgrade():
     op.execute("CREATE SCHEMA IF NOT EXISTS app")
@@ -34,10 +55,17 @@ def upgrade():
         )
         """
     )
-    op.execute("ALTER TABLE app.unsorted_files ADD COLUMN IF NOT EXISTS original_path TEXT NOT NULL DEFAULT ''")
-    op.execute("ALTER TABLE app.unsorted_files ADD COLUMN IF NOT EXISTS origin_text TEXT NOT NULL DEFAULT ''")
-    op.execute("ALTER TABLE app.unsorted_files ADD COLUMN IF NOT EXISTS mime_type TEXT")
-    op.execute("ALTER TABLE app.unsorted_files ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ NOT NULL DEFAULT now()")
+    # Pre-existing installs may predate these columns; fresh ones get them from CREATE TABLE above.
+    if _missing_unsorted_file_columns(op.get_bind()):
+        op.execute(
+            """
+            ALTER TABLE app.unsorted_files
+                ADD COLUMN IF NOT EXISTS original_path TEXT NOT NULL DEFAULT '',
+                ADD COLUMN IF NOT EXISTS origin_text TEXT NOT NULL DEFAULT '',
+                ADD COLUMN IF NOT EXISTS mime_type TEXT,
+                ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+            """
+        )
 
     op.execute(
         """
@@ -78,17 +106,39 @@ def upgrade():
         """
     )
 
-    op.execute("CREATE INDEX IF NOT EXISTS idx_unsorted_files_created_at ON app.unsorted_files(created_at)")
-    op.execute("CREATE INDEX IF NOT EXISTS idx_unsorted_files_uploaded_by ON app.unsorted_files(uploaded_by_user_id)")
-    op.execute("CREATE INDEX IF NOT EXISTS idx_unsorted_actions_file_id ON app.unsorted_file_actions(unsorted_file_id)")
-    op.execute("CREATE INDEX IF NOT EXISTS idx_unsorted_actions_actor ON app.unsorted_file_actions(actor_user_id)")
-    op.execute("CREATE INDEX IF NOT EXISTS idx_unsorted_actions_type ON app.unsorted_file_actions(action_type)")
-    op.execute(
-        """
-        CREATE INDEX IF NOT EXISTS idx_unsorted_push_proposals_file_source
-        ON app.unsorted_file_push_proposals(unsorted_file_id, source_id)
-        """
-    )
+    # Build indexes outside the migration transaction so live writes are not blocked.
+    with op.get_context().autocommit_block():
+        # unsorted_files is append-only, so created_at follows heap order and BRIN is enough for time-range scans.
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_unsorted_files_created_at_brin
+            ON app.unsorted_files USING BRIN (created_at) WITH (pages_per_range = 16)
+            """
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_unsorted_files_uploaded_by ON app.unsorted_files(uploaded_by_user_id)"
+        )
+        # unsorted_file_id lookups are served by the UNIQUE (unsorted_file_id, actor_user_id) index.
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_unsorted_actions_actor_recent
+            ON app.unsorted_file_actions(actor_user_id, unsorted_file_id, updated_at DESC)
+            INCLUDE (action_type, source_slug)
+            """
+        )
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_unsorted_actions_create_new_source
+            ON app.unsorted_file_actions(unsorted_file_id, updated_at DESC)
+            WHERE lower(action_type) = 'create_new_source'
+            """
+        )
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_unsorted_push_proposals_file_source
+            ON app.unsorted_file_push_proposals(unsorted_file_id, source_id)
+            """
+        )
 
 
 def downgrade():
@@ -37,18 +37,6 @@ def upgrade():
         """
     )
 
-    op.execute(
-        """
-        CREATE INDEX IF NOT EXISTS idx_unsorted_tag_proposals_file_status
-        ON app.unsorted_file_tag_proposals(unsorted_file_id, status)
-        """
-    )
-    op.execute(
-        """
-        CREATE INDEX IF NOT EXISTS idx_unsorted_tag_proposals_proposer_file
-        ON app.unsorted_file_tag_proposals(proposer_user_id, unsorted_file_id)
-        """
-    )
     op.execute(
         """
         CREATE TABLE IF NOT EXISTS app.unsorted_file_tag_proposal_tags (
@@ -62,18 +50,33 @@ def upgrade():
         )
         """
     )
-    op.execute(
-        """
-        CREATE INDEX IF NOT EXISTS idx_unsorted_tag_proposal_tags_proposal
-        ON app.unsorted_file_tag_proposal_tags(proposal_id)
-        """
-    )
-    op.execute(
-        """
-        CREATE INDEX IF NOT EXISTS idx_unsorted_tag_proposal_tags_code
-        ON app.unsorted_file_tag_proposal_tags(tag_code)
-        """
-    )
+
+    # Build indexes outside the migration transaction so live writes are not blocked.
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_unsorted_tag_proposals_file_status
+            ON app.unsorted_file_tag_proposals(unsorted_file_id, status)
+            """
+        )
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_unsorted_tag_proposals_proposer_file
+            ON app.unsorted_file_tag_proposals(proposer_user_id, unsorted_file_id)
+            """
+        )
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_unsorted_tag_proposal_tags_proposal
+            ON app.unsorted_file_tag_proposal_tags(proposal_id)
+            """
+        )
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_unsorted_tag_proposal_tags_code
+            ON app.unsorted_file_tag_proposal_tags(tag_code)
+            """
+        )
 
 
 def downgrade():
@@ -7,6 +7,7 @@ Create Date: 2026-02-20
 
 from alembic import op
 from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
 
 revision = "012_unique_people_name_normalized"
 down_revision = "011_add_unsorted_file_tag_proposals"
@@ -29,24 +30,24 @@ def _find_duplicate_people_names(bind):
                 SELECT
                     normalized_name,
                     COUNT(*) AS row_count,
-                    ARRAY_AGG(id ORDER BY id) AS person_ids
+                    (ARRAY_AGG(id ORDER BY id))[1:20] AS person_ids
                 FROM people_rows
                 GROUP BY normalized_name
                 HAVING COUNT(*) > 1
+                ORDER BY normalized_name
+                LIMIT 10
             )
             SELECT
                 d.normalized_name,
                 d.row_count,
                 d.person_ids,
-                COALESCE(
-                    (
-                        SELECT ARRAY_AGG(c.slug ORDER BY c.slug)
-                        FROM app.people_cards c
-                        WHERE c.person_id = ANY(d.person_ids)
-                    ),
-                    ARRAY[]::text[]
-                ) AS card_slugs
+                COALESCE(card_rows.slugs, ARRAY[]::text[]) AS card_slugs
             FROM duplicate_names d
+            LEFT JOIN LATERAL (
+                SELECT (ARRAY_AGG(c.slug ORDER BY c.slug))[1:20] AS slugs
+                FROM UNNEST(d.person_ids) AS dup(id)
+                JOIN app.people_cards c ON c.person_id = dup.id
+            ) card_rows ON TRUE
             ORDER BY d.normalized_name
             LIMIT 10
             """
@@ -55,11 +56,23 @@ def _find_duplicate_people_names(bind):
 
 
 def upgrade():
-    bind = op.get_bind()
-    duplicate_rows = _find_duplicate_people_names(bind)
-    if duplicate_rows:
+    # The unique index build is itself the duplicate check; only report on failure.
+    try:
+        with op.get_context().autocommit_block():
+            op.execute(
+                """
+                CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ux_people_name_normalized
+                ON app.people ((LOWER(BTRIM(name))))
+                WHERE NULLIF(BTRIM(name), '') IS NOT NULL
+                """
+            )
+    except IntegrityError as exc:
+        # A failed concurrent build leaves an invalid index behind; drop it so a retry rebuilds it.
+        with op.get_context().autocommit_block():
+            op.execute("DROP INDEX CONCURRENTLY IF EXISTS app.ux_people_name_normalized")
+
         formatted = []
-        for row in duplicate_rows:
+        for row in _find_duplicate_people_names(op.get_bind()):
             normalized_name = str(row.get("normalized_name") or "")
             person_ids = ", ".join(str(item) for item in (row.get("person_ids") or []))
             card_slugs = ", ".join(str(item) for item in (row.get("card_slugs") or []))
@@ -71,16 +84,9 @@ def upgrade():
         raise RuntimeError(
             "Cannot add unique people-name index because duplicate normalized names already exist. "
             f"Resolve duplicates first. Sample conflicts: {sample}"
-        )
-
-    op.execute(
-        """
-        CREATE UNIQUE INDEX IF NOT EXISTS ux_people_name_normalized
-        ON app.people ((LOWER(BTRIM(name))))
-        WHERE NULLIF(BTRIM(name), '') IS NOT NULL
-        """
-    )
+        ) from exc
 
 
 def downgrade():
-    op.execute("DROP INDEX IF EXISTS app.ux_people_name_normalized")
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS app.ux_people_name_normalized")
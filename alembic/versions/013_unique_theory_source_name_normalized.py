@@ -14,6 +14,24 @@ branch_labels = None
 depends_on = None
 
 
+def _has_duplicate_names(bind, table_name):
+    return (
+        bind.execute(
+            text(
+                f"""
+                SELECT 1
+                FROM {table_name}
+                WHERE NULLIF(BTRIM(name), '') IS NOT NULL
+                GROUP BY LOWER(BTRIM(name))
+                HAVING COUNT(*) > 1
+                LIMIT 1
+                """
+            )
+        ).first()
+        is not None
+    )
+
+
 def _find_duplicate_theory_names(bind):
     return bind.execute(
         text(
@@ -29,24 +47,24 @@ def _find_duplicate_theory_names(bind):
                 SELECT
                     normalized_name,
                     COUNT(*) AS row_count,
-                    ARRAY_AGG(id ORDER BY id) AS theory_ids
+                    (ARRAY_AGG(id ORDER BY id))[1:20] AS theory_ids
                 FROM theory_rows
                 GROUP BY normalized_name
                 HAVING COUNT(*) > 1
+                ORDER BY normalized_name
+                LIMIT 10
             )
             SELECT
                 d.normalized_name,
                 d.row_count,
                 d.theory_ids,
-                COALESCE(
-                    (
-                        SELECT ARRAY_AGG(c.slug ORDER BY c.slug)
-                        FROM app.theory_cards c
-                        WHERE c.person_id = ANY(d.theory_ids)
-                    ),
-                    ARRAY[]::text[]
-                ) AS card_slugs
+                COALESCE(card_rows.slugs, ARRAY[]::text[]) AS card_slugs
             FROM duplicate_names d
+            LEFT JOIN LATERAL (
+                SELECT (ARRAY_AGG(c.slug ORDER BY c.slug))[1:20] AS slugs
+                FROM UNNEST(d.theory_ids) AS dup(id)
+                JOIN app.theory_cards c ON c.person_id = dup.id
+            ) card_rows ON TRUE
             ORDER BY d.normalized_name
             LIMIT 10
             """
@@ -69,8 +87,8 @@ def _find_duplicate_source_names(bind):
             SELECT
                 normalized_name,
                 COUNT(*) AS row_count,
-                ARRAY_AGG(id ORDER BY id) AS source_ids,
-                ARRAY_AGG(slug ORDER BY slug) AS source_slugs
+                (ARRAY_AGG(id ORDER BY id))[1:20] AS source_ids,
+                (ARRAY_AGG(slug ORDER BY slug))[1:20] AS source_slugs
             FROM source_rows
             GROUP BY normalized_name
             HAVING COUNT(*) > 1
@@ -84,7 +102,9 @@ def _find_duplicate_source_names(bind):
 def upgrade():
     bind = op.get_bind()
 
-    duplicate_theory_rows = _find_duplicate_theory_names(bind)
+    duplicate_theory_rows = (
+        _find_duplicate_theory_names(bind) if _has_duplicate_names(bind, "app.theories") else []
+    )
     if duplicate_theory_rows:
         formatted = []
         for row in duplicate_theory_rows:
@@ -101,7 +121,9 @@ def upgrade():
             f"Resolve duplicates first. Sample conflicts: {sample}"
         )
 
-    duplicate_source_rows = _find_duplicate_source_names(bind)
+    duplicate_source_rows = (
+        _find_duplicate_source_names(bind) if _has_duplicate_names(bind, "app.sources_cards") else []
+    )
     if duplicate_source_rows:
         formatted = []
         for row in duplicate_source_rows:
@@ -118,22 +140,24 @@ def upgrade():
             f"Resolve duplicates first. Sample conflicts: {sample}"
         )
 
-    op.execute(
-        """
-        CREATE UNIQUE INDEX IF NOT EXISTS ux_theories_name_normalized
-        ON app.theories ((LOWER(BTRIM(name))))
-        WHERE NULLIF(BTRIM(name), '') IS NOT NULL
-        """
-    )
-    op.execute(
-        """
-        CREATE UNIQUE INDEX IF NOT EXISTS ux_sources_cards_name_normalized
-        ON app.sources_cards ((LOWER(BTRIM(name))))
-        WHERE NULLIF(BTRIM(name), '') IS NOT NULL
-        """
-    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ux_theories_name_normalized
+            ON app.theories ((LOWER(BTRIM(name))))
+            WHERE NULLIF(BTRIM(name), '') IS NOT NULL
+            """
+        )
+        op.execute(
+            """
+            CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ux_sources_cards_name_normalized
+            ON app.sources_cards ((LOWER(BTRIM(name))))
+            WHERE NULLIF(BTRIM(name), '') IS NOT NULL
+            """
+        )
 
 
 def downgrade():
-    op.execute("DROP INDEX IF EXISTS app.ux_sources_cards_name_normalized")
-    op.execute("DROP INDEX IF EXISTS app.ux_theories_name_normalized")
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS app.ux_sources_cards_name_normalized")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS app.ux_theories_name_normalized")
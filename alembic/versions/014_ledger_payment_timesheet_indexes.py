@@ -0,0 +1,66 @@
+"""Covering/partial payment indexes, a BRIN on credit_ledger.created_at and a covering timesheet_sends index.
+
+Revision ID: 014_ledger_payment_timesheet_indexes
+Revises: 013_unique_theory_source_name_normalized
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+
+revision = "014_ledger_payment_timesheet_indexes"
+down_revision = "013_unique_theory_source_name_normalized"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Build indexes outside the migration transaction so live writes are not blocked.
+    with op.get_context().autocommit_block():
+        # Webhook dedup looks up (provider, provider_event_id); keep it index-only.
+        op.execute(
+            """
+            CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ix_payment_provider_event_covering
+            ON payment (provider, provider_event_id)
+            INCLUDE (user_id, amount_cents, credits_granted, status)
+            """
+        )
+        # Replace the full status index with a partial one over the pending rows it is used for.
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_payment_status_pending
+            ON payment (status)
+            WHERE status = 'pending'
+            """
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_payment_status")
+        # Append-only ledger: created_at follows heap order, so a BRIN serves time-range scans cheaply.
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_ledger_created_at_brin
+            ON credit_ledger USING BRIN (created_at) WITH (pages_per_range = 32)
+            """
+        )
+        # INCLUDE cannot be added in place: build the covering index, then drop the plain one.
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_timesheet_sends_center_month_covering
+            ON app.timesheet_sends (center_id, month)
+            INCLUDE (sent_at, modified)
+            """
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS app.ix_timesheet_sends_center_month")
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_timesheet_sends_center_month
+            ON app.timesheet_sends (center_id, month)
+            """
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS app.ix_timesheet_sends_center_month_covering")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_ledger_created_at_brin")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_payment_status ON payment (status)")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_payment_status_pending")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_payment_provider_event_covering")
@@ -1,10 +1,12 @@
 # ---- Resolve & inject ALL secrets BEFORE importing modules that read env ----
-from src.secrets import get_secret
+from src.secrets import resolve_secrets
 
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import FileResponse, RedirectResponse, Response
+from fastapi.responses import FileResponse, RedirectResponse, Response, StreamingResponse
+from starlette.datastructures import Headers, QueryParams
 from starlette.staticfiles import StaticFiles
 from datetime import datetime, timezone
+from functools import lru_cache, partial
 from email.utils import format_datetime, parsedate_to_datetime
 from pathlib import Path
 from urllib.parse import quote
@@ -29,60 +31,294 @@ def _install_proxy_headers(app: FastAPI) -> None:
     except ImportError:
         pass
 
-    from starlette.middleware.base import BaseHTTPMiddleware
+    def _first_value(raw_value: bytes) -> str:
+        return raw_value.decode("latin-1").split(",")[0].strip()
 
-    class _Proxy(BaseHTTPMiddleware):
-        async def dispatch(self, request, call_next):
-            forwarded_proto = request.headers.get("x-forwarded-proto")
-            if forwarded_proto:
-                request.scope["scheme"] = forwarded_proto.split(",")[0].strip()
+    class _Proxy:
+        """Plain ASGI middleware: rewrites scheme/server from X-Forwarded-* in place."""
 
-            forwarded_host = request.headers.get("x-forwarded-host")
-            forwarded_port = request.headers.get("x-forwarded-port")
-            server = request.scope.get("server", (None, None))
+        def __init__(self, app):
+            self.app = app
 
-            host = forwarded_host.split(",")[0].strip() if forwarded_host else server[0]
-            port = (
-                int(forwarded_port.split(",")[0])
-                if forwarded_port and forwarded_port.split(",")[0].isdigit()
-                else server[1]
-            )
-            if host or port:
-                request.scope["server"] = (host, port)
+        async def __call__(self, scope, receive, send):
+            if scope["type"] != "http":
+                return await self.app(scope, receive, send)
+
+            forwarded_proto = forwarded_host = forwarded_port = None
+            for name, value in scope["headers"]:
+                if name == b"x-forwarded-proto":
+                    forwarded_proto = value
+                elif name == b"x-forwarded-host":
+                    forwarded_host = value
+                elif name == b"x-forwarded-port":
+                    forwarded_port = value
+
+            if forwarded_proto:
+                scope["scheme"] = _first_value(forwarded_proto)
 
-            return await call_next(request)
+            if forwarded_host or forwarded_port:
+                server = scope.get("server") or (None, None)
+                host = _first_value(forwarded_host) if forwarded_host else server[0]
+                port_text = _first_value(forwarded_port) if forwarded_port else ""
+                port = int(port_text) if port_text.isdigit() else server[1]
+                if host or port:
+                    scope["server"] = (host, port)
+
+            return await self.app(scope, receive, send)
 
     app.add_middleware(_Proxy)
 
+import gzip
 import os
+import re
+import asyncio
+import itertools
 import mimetypes
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterator
+
 import gradio as gr
 
 from src.login_logic import register_oauth_provider, add_login_snippet_route
 from src.pages.ui_login import make_login_page
-from src.pages.ui_profile import make_profile_app
-from src.mount_gradio_app import mount_gradio_app
-from src.pages.ui_home import make_home_app
-from src.pages.admin.app_admin import make_admin_app
-from src.pages.the_list.app_the_list import make_the_list_app
-from src.pages.theories.app_theories import make_theories_app
-from src.pages.sources_list.app_sources import make_sources_app
-from src.pages.sources_list.app_sources_create import make_sources_create_app
-from src.pages.sources_individual.app_sources_individual import make_sources_individual_app
-from src.pages.unsorted_files.app_unsorted_files import make_unsorted_files_app
-from src.pages.people_display.app_people_display import make_people_display_app
-from src.pages.theory_display.app_theory_display import make_theory_display_app
-from src.pages.people_display.app_people_create import make_people_create_app
-from src.pages.theory_display.app_theory_create import make_theory_create_app
-from src.pages.review_display.app_review_display import make_review_display_app
-from src.pages.privileges.app_privileges import make_privileges_app
-from src.gcs_storage import blob_http_metadata, download_bytes
+from src.mount_gradio_app import MountTable, add_session_middleware, mount_lazy_gradio_app
+from src.gcs_storage import blob_http_metadata, download_bytes, download_stream
 
 app = FastAPI()
 _install_proxy_headers(app)
 
-MEDIA_CACHE_CONTROL_REVALIDATE = "public, max-age=0, must-revalidate"
+def _parse_cache_seconds(raw_value: str | None, default: float) -> float:
+    try:
+        return max(0.0, float(raw_value or default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _parse_env_int(raw_value: str | None, default: int) -> int:
+    try:
+        return max(0, int(raw_value or default))
+    except (TypeError, ValueError):
+        return default
+
+
+# Browsers always revalidate unversioned media; a CDN/nginx tier may reuse it for `s-maxage`.
+MEDIA_SHARED_MAX_AGE = int(_parse_cache_seconds(os.getenv("MEDIA_SHARED_MAX_AGE"), 60.0))
+MEDIA_CACHE_CONTROL_REVALIDATE = f"public, max-age=0, s-maxage={MEDIA_SHARED_MAX_AGE}, must-revalidate"
 MEDIA_CACHE_CONTROL_VERSIONED = "public, max-age=31536000, immutable"
+MEDIA_VERSIONED_HEADERS = {"Cache-Control": MEDIA_CACHE_CONTROL_VERSIONED, "Vary": "Accept-Encoding"}
+MEDIA_STREAM_CHUNK_SIZE = 1024 * 1024
+# `?v=` tokens are echoed into the ETag header and key the payload caches, so only plain
+# tokens (the app emits integer versions) are honoured; anything else is served unversioned.
+_MEDIA_VERSION_TOKEN_RE = re.compile(r"[A-Za-z0-9._-]{1,128}")
+
+
+@lru_cache(maxsize=1024)
+def _guess_media_type(extension: str) -> str:
+    return mimetypes.guess_type(f"media{extension}")[0] or "application/octet-stream"
+
+
+MEDIA_META_CACHE_SECONDS = _parse_cache_seconds(os.getenv("MEDIA_META_CACHE_TTL"), 30.0)
+MEDIA_META_MISS_CACHE_SECONDS = min(5.0, MEDIA_META_CACHE_SECONDS)
+MEDIA_META_CACHE_MAX_ENTRIES = 4096
+_MEDIA_META_CACHE_LOCK = threading.Lock()
+# blob name -> (expires_at, metadata tuple or None for a cached 404), kept in LRU order.
+_MEDIA_META_CACHE: OrderedDict[str, tuple[float, tuple | None]] = OrderedDict()
+
+
+def _set_cached_media_meta(blob_name: str, metadata: tuple | None, ttl_seconds: float) -> None:
+    if ttl_seconds <= 0:
+        return
+    expires_at = time.monotonic() + ttl_seconds
+    with _MEDIA_META_CACHE_LOCK:
+        _MEDIA_META_CACHE[blob_name] = (expires_at, metadata)
+        _MEDIA_META_CACHE.move_to_end(blob_name)
+        while len(_MEDIA_META_CACHE) > MEDIA_META_CACHE_MAX_ENTRIES:
+            _MEDIA_META_CACHE.popitem(last=False)
+
+
+def _get_cached_media_meta(blob_name: str) -> tuple | None:
+    """Return cached metadata, None on a miss, or raise FileNotFoundError for a cached 404."""
+    now = time.monotonic()
+    with _MEDIA_META_CACHE_LOCK:
+        entry = _MEDIA_META_CACHE.get(blob_name)
+        if entry is None:
+            return None
+        expires_at, metadata = entry
+        if now >= expires_at:
+            _MEDIA_META_CACHE.pop(blob_name, None)
+            return None
+        _MEDIA_META_CACHE.move_to_end(blob_name)
+    if metadata is None:
+        raise FileNotFoundError(blob_name)
+    return metadata
+
+
+def _evict_media_meta(blob_name: str) -> None:
+    with _MEDIA_META_CACHE_LOCK:
+        _MEDIA_META_CACHE.pop(blob_name, None)
+
+
+class _StaleMediaMetadata(Exception):
+    """The cached generation of a blob is gone: it was overwritten after its metadata was cached."""
+
+
+def _load_media_meta(blob_name: str) -> tuple:
+    try:
+        metadata = blob_http_metadata(blob_name)
+    except FileNotFoundError:
+        _set_cached_media_meta(blob_name, None, MEDIA_META_MISS_CACHE_SECONDS)
+        raise
+    _set_cached_media_meta(blob_name, metadata, MEDIA_META_CACHE_SECONDS)
+    return metadata
+
+
+# Concurrent cache misses for the same key share one upstream fetch.
+_INFLIGHT: dict[str, asyncio.Task] = {}
+
+
+def _finish_inflight(key: str, task: asyncio.Task) -> None:
+    if _INFLIGHT.get(key) is task:
+        del _INFLIGHT[key]
+    # Mark the error as retrieved when no request was left waiting on it.
+    if not task.cancelled():
+        task.exception()
+
+
+async def _single_flight(key: str, func, *args):
+    # The fetch runs in its own task and every caller (the first included) awaits it shielded,
+    # so a disconnecting client only cancels its own wait, never the shared fetch.
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(asyncio.to_thread(func, *args))
+        _INFLIGHT[key] = task
+        task.add_done_callback(lambda done: _finish_inflight(key, done))
+    return await asyncio.shield(task)
+
+
+async def _media_metadata(blob_name: str) -> tuple:
+    """`blob_http_metadata` behind a short in-process TTL cache (missing blobs are cached briefly too)."""
+    metadata = _get_cached_media_meta(blob_name)
+    if metadata is not None:
+        return metadata
+    return await _single_flight(f"meta:{blob_name}", _load_media_meta, blob_name)
+
+
+class _BytesLRU:
+    """Thread-safe LRU of byte payloads bounded by their total size."""
+
+    def __init__(self, max_bytes: int, item_max_bytes: int):
+        self.max_bytes = max_bytes
+        self.item_max_bytes = min(item_max_bytes, max_bytes)
+        self._lock = threading.Lock()
+        self._items: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+        self._size = 0
+
+    def get(self, key: tuple[str, str]) -> bytes | None:
+        with self._lock:
+            payload = self._items.get(key)
+            if payload is not None:
+                self._items.move_to_end(key)
+            return payload
+
+    def set(self, key: tuple[str, str], payload: bytes) -> None:
+        if len(payload) > self.item_max_bytes:
+            return
+        with self._lock:
+            previous = self._items.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._items[key] = payload
+            self._size += len(payload)
+            while self._size > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self._size -= len(evicted)
+
+
+MEDIA_PAYLOAD_CACHE_BYTES = _parse_env_int(os.getenv("MEDIA_PAYLOAD_CACHE_BYTES"), 128 * 1024 * 1024)
+MEDIA_PAYLOAD_CACHE_ITEM_MAX = _parse_env_int(os.getenv("MEDIA_CACHE_ITEM_MAX"), 1024 * 1024)
+MEDIA_GZIP_CACHE_BYTES = _parse_env_int(os.getenv("MEDIA_GZIP_CACHE_BYTES"), 32 * 1024 * 1024)
+MEDIA_COMPRESSIBLE_TYPES = frozenset({
+    "application/javascript",
+    "application/json",
+    "image/svg+xml",
+    "text/css",
+    "text/html",
+    "text/javascript",
+    "text/plain",
+})
+# (blob name, version token or blob etag) -> bytes; both keys change whenever the content does.
+_MEDIA_PAYLOAD_CACHE = _BytesLRU(MEDIA_PAYLOAD_CACHE_BYTES, MEDIA_PAYLOAD_CACHE_ITEM_MAX)
+_MEDIA_GZIP_CACHE = _BytesLRU(MEDIA_GZIP_CACHE_BYTES, MEDIA_PAYLOAD_CACHE_ITEM_MAX)
+
+
+def _load_media_payload(key: tuple[str, str]) -> bytes:
+    payload = download_bytes(key[0])
+    _MEDIA_PAYLOAD_CACHE.set(key, payload)
+    return payload
+
+
+async def _media_payload(blob_name: str, cache_token: str, size: int | None = None) -> bytes | None:
+    """Payload bytes for a small blob, or None when it is too large to keep in memory."""
+    key = (blob_name, cache_token)
+    payload = _MEDIA_PAYLOAD_CACHE.get(key)
+    if payload is not None:
+        return payload
+    if size is None:
+        size = (await _media_metadata(blob_name))[3]
+    if size is None or size > MEDIA_PAYLOAD_CACHE_ITEM_MAX:
+        return None
+    return await _single_flight(f"payload:{blob_name}:{cache_token}", _load_media_payload, key)
+
+
+def _compress_media_payload(key: tuple[str, str], payload: bytes) -> bytes:
+    # mtime=0 keeps the gzip bytes identical across workers and restarts.
+    compressed = gzip.compress(payload, compresslevel=6, mtime=0)
+    _MEDIA_GZIP_CACHE.set(key, compressed)
+    return compressed
+
+
+async def _gzip_media_payload(blob_name: str, cache_token: str, payload: bytes) -> bytes:
+    key = (blob_name, cache_token)
+    compressed = _MEDIA_GZIP_CACHE.get(key)
+    if compressed is not None:
+        return compressed
+    return await _single_flight(f"gzip:{blob_name}:{cache_token}", _compress_media_payload, key, payload)
+
+
+@lru_cache(maxsize=256)
+def _accepts_gzip(header_value: str) -> bool:
+    for item in header_value.split(","):
+        coding, _, params = item.partition(";")
+        if coding.strip().lower() not in ("gzip", "*"):
+            continue
+        quality = params.strip().lower()
+        return not (quality.startswith("q=") and quality[2:].strip() in ("0", "0.0", "0.00", "0.000"))
+    return False
+
+
+def _is_compressible(media_type: str) -> bool:
+    return media_type.split(";")[0].strip().lower() in MEDIA_COMPRESSIBLE_TYPES
+
+
+async def _media_payload_response(
+    request: Request,
+    blob_name: str,
+    cache_token: str,
+    payload: bytes,
+    *,
+    media_type: str,
+    headers: dict[str, str],
+) -> Response:
+    """Serve an in-memory payload, gzip-encoded (and cached) for compressible types when accepted."""
+    if _is_compressible(media_type) and _accepts_gzip(request.headers.get("accept-encoding", "")):
+        payload = await _gzip_media_payload(blob_name, cache_token, payload)
+        headers = {**headers, "Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+        if headers.get("ETag"):
+            # The gzip bytes are a different representation, so they get their own validator.
+            headers["ETag"] = _gzip_etag(headers["ETag"])
+    return Response(payload, media_type=media_type, headers=headers)
 
 
 def _quote_etag(raw_etag: str | None) -> str:
@@ -97,39 +333,85 @@ def _quote_etag(raw_etag: str | None) -> str:
     return f'"{value}"'
 
 
+def _gzip_etag(etag: str) -> str:
+    """Apache-style `"tag-gzip"` validator for the gzip-encoded variant of `etag`."""
+    return f'{etag[:-1]}-gzip"' if etag.endswith('"') else etag
+
+
+def _weak_etag(size: int | None, mtime: datetime | None) -> str:
+    """Apache-style `W/"size-mtime"` validator: no hashing, just the stat-like metadata."""
+    if size is None or mtime is None:
+        return ""
+    return f'W/"{size:x}-{int(mtime.timestamp()):x}"'
+
+
+@lru_cache(maxsize=1024)
+def _parse_if_none_match(header_value: str) -> frozenset[str]:
+    # Browsers resend the same validator list, so the parsed form is memoized per header value.
+    return frozenset(
+        token.strip().removeprefix("W/").strip().strip('"')
+        for token in header_value.split(",")
+    )
+
+
 def _etag_matches(header_value: str | None, current_etag: str) -> bool:
     if not header_value or not current_etag:
         return False
     current = current_etag.removeprefix("W/").strip().strip('"')
     if not current:
         return False
-    for token in str(header_value).split(","):
-        candidate = token.strip()
-        if not candidate:
-            continue
-        if candidate == "*":
-            return True
-        if candidate.removeprefix("W/").strip().strip('"') == current:
-            return True
-    return False
+    tags = _parse_if_none_match(header_value)
+    return "*" in tags or current in tags
+
 
+_HTTP_DATE_RE = re.compile(r"^[A-Z][a-z]{2}, (\d{2}) ([A-Z][a-z]{2}) (\d{4}) (\d{2}):(\d{2}):(\d{2}) GMT$")
+_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
 
+
+@lru_cache(maxsize=4096)
 def _parse_http_date(header_value: str | None) -> datetime | None:
     if not header_value:
         return None
+    # Browsers echo back our own IMF-fixdate; other RFC 2822 forms take the stdlib path.
+    match = _HTTP_DATE_RE.match(header_value)
+    if match is not None:
+        day, month, year, hour, minute, second = match.groups()
+        month_number = _MONTHS.get(month)
+        if month_number is not None:
+            try:
+                return datetime(
+                    int(year), month_number, int(day), int(hour), int(minute), int(second), tzinfo=timezone.utc
+                )
+            except ValueError:
+                return None
     try:
         parsed = parsedate_to_datetime(header_value)
     except (TypeError, ValueError, IndexError, OverflowError):
         return None
     if parsed.tzinfo is None:
-        parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.replace(tzinfo=timezone.utc)
+    if parsed.tzinfo is timezone.utc:
+        return parsed
     return parsed.astimezone(timezone.utc)
 
 
+def _utc_second(value: datetime) -> datetime:
+    # HTTP dates have whole-second precision, while GCS `updated` carries milliseconds.
+    return value.astimezone(timezone.utc).replace(microsecond=0)
+
+
+@lru_cache(maxsize=1024)
+def _format_http_date_cached(value: datetime) -> str:
+    return format_datetime(_utc_second(value), usegmt=True)
+
+
 def _format_http_date(value: datetime | None) -> str:
     if value is None:
         return ""
-    return format_datetime(value.astimezone(timezone.utc).replace(microsecond=0), usegmt=True)
+    return _format_http_date_cached(value)
 
 
 def _is_not_modified(
@@ -139,7 +421,7 @@ def _is_not_modified(
     updated_at: datetime | None,
 ) -> bool:
     if_none_match = request.headers.get("if-none-match")
-    if _etag_matches(if_none_match, etag):
+    if _etag_matches(if_none_match, etag) or _etag_matches(if_none_match, _gzip_etag(etag)):
         return True
 
     if if_none_match:
@@ -148,36 +430,201 @@ def _is_not_modified(
     if_modified_since = _parse_http_date(request.headers.get("if-modified-since"))
     if if_modified_since is None or updated_at is None:
         return False
-    return updated_at.astimezone(timezone.utc).replace(microsecond=0) <= if_modified_since
+    return _utc_second(updated_at) <= if_modified_since
+
+def _not_modified_response(request: Request, etag: str, headers: dict[str, str]) -> Response:
+    # Echo the gzip validator back to clients that revalidated their gzip copy.
+    if_none_match = request.headers.get("if-none-match")
+    if (
+        etag
+        and not _etag_matches(if_none_match, etag)
+        and _etag_matches(if_none_match, _gzip_etag(etag))
+    ):
+        headers = {**headers, "ETag": _gzip_etag(etag)}
+    return Response(status_code=304, headers=headers)
+
+
+def _parse_byte_range(header_value: str | None) -> tuple[int | None, int | None] | None:
+    """Parse a single `bytes=start-end` range; multi-range or malformed headers are ignored."""
+    if not header_value:
+        return None
+    unit, _, spec = header_value.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    start_text, separator, end_text = spec.strip().partition("-")
+    if not separator:
+        return None
+    try:
+        start = int(start_text) if start_text.strip() else None
+        end = int(end_text) if end_text.strip() else None
+    except ValueError:
+        return None
+    if start is None and end is None:
+        return None
+    return start, end
+
+
+def _resolve_byte_range(byte_range: tuple[int | None, int | None], size: int) -> tuple[int, int] | None:
+    """Clamp a parsed range to an inclusive (start, end) within `size`; None when unsatisfiable."""
+    start, end = byte_range
+    if start is None:
+        if not end or end < 0 or size <= 0:
+            return None
+        return max(0, size - end), size - 1
+    if start >= size or (end is not None and end < start):
+        return None
+    return start, size - 1 if end is None else min(end, size - 1)
+
+
+def _evict_on_missing_generation(blob_name: str, chunks: Iterator[bytes]) -> Iterator[bytes]:
+    try:
+        yield from chunks
+    except FileNotFoundError:
+        # Overwritten mid-stream: the headers are out, so the body is aborted rather than mixing
+        # generations, and the next request re-reads the metadata.
+        _evict_media_meta(blob_name)
+        raise
+
+
+async def _open_media_stream(
+    blob_name: str,
+    *,
+    start: int = 0,
+    end: int | None = None,
+    generation: int | None = None,
+) -> Iterator[bytes]:
+    # Pull the first chunk eagerly so a missing blob becomes a 404 before any headers are sent.
+    # GCS reads block, so they run in a worker thread (StreamingResponse does the same for later chunks).
+    try:
+        chunks = download_stream(
+            blob_name, start=start, end=end, chunk_size=MEDIA_STREAM_CHUNK_SIZE, generation=generation
+        )
+        first_chunk = await asyncio.to_thread(next, chunks, b"")
+    except FileNotFoundError:
+        if generation is not None:
+            # The length/range headers came from cached metadata for a generation that no longer exists.
+            _evict_media_meta(blob_name)
+            raise _StaleMediaMetadata(blob_name)
+        raise HTTPException(status_code=404)
+    except Exception:
+        raise HTTPException(status_code=500, detail="Media fetch failed")
+    if generation is not None:
+        chunks = _evict_on_missing_generation(blob_name, chunks)
+    return itertools.chain((first_chunk,), chunks)
+
+
+async def _stream_media(
+    request: Request,
+    blob_name: str,
+    *,
+    media_type: str,
+    headers: dict[str, str],
+    size: int | None,
+    generation: int | None = None,
+) -> Response:
+    """
+    Stream a blob, optionally as a single byte range. `size` and `generation` come from the same
+    (cached) metadata, so the reads are pinned to the generation those length headers describe.
+    """
+    headers = {**headers, "Accept-Ranges": "bytes", "Vary": "Accept-Encoding"}
+    byte_range = _parse_byte_range(request.headers.get("range")) if size is not None else None
+    if byte_range is None:
+        if size is not None:
+            headers["Content-Length"] = str(size)
+        return StreamingResponse(
+            await _open_media_stream(blob_name, generation=generation), media_type=media_type, headers=headers
+        )
+
+    resolved = _resolve_byte_range(byte_range, size)
+    if resolved is None:
+        headers["Content-Range"] = f"bytes */{size}"
+        return Response(status_code=416, headers=headers)
+    start, end = resolved
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        await _open_media_stream(blob_name, start=start, end=end, generation=generation),
+        status_code=206,
+        media_type=media_type,
+        headers=headers,
+    )
+
 
 @app.get("/_routes")
 def _routes():
-    return [getattr(r, "path", str(r)) for r in app.router.routes]
-
-
-@app.middleware("http")
-async def redirect_the_list_slug_to_people_display(request: Request, call_next):
-    normalized_path = (request.url.path or "/").rstrip("/") or "/"
-    if normalized_path == "/the-list":
-        slug = str(request.query_params.get("slug", "")).strip().lower()
-        if slug:
-            target = f"/people-display/?slug={quote(slug, safe='-')}"
-            return RedirectResponse(url=target, status_code=307)
-    if normalized_path == "/theories":
-        slug = str(request.query_params.get("slug", "")).strip().lower()
-        if slug:
-            target = f"/theory-display/?slug={quote(slug, safe='-')}"
-            return RedirectResponse(url=target, status_code=307)
-    if normalized_path == "/sources":
-        slug = str(request.query_params.get("source", "")).strip().lower()
-        if slug:
-            target = f"/sources-individual/?slug={quote(slug, safe='-')}"
-            return RedirectResponse(url=target, status_code=307)
-    return await call_next(request)
-
-# OAuth client config (now guaranteed in env; also available via get_secret)
-GOOGLE_CLIENT_ID     = get_secret("GOOGLE_CLIENT_ID")
-GOOGLE_CLIENT_SECRET = get_secret("GOOGLE_CLIENT_SECRET")
+    paths: list[str] = []
+    for route in app.router.routes:
+        if isinstance(route, MountTable):
+            paths.extend(route.mounts)
+        else:
+            paths.append(getattr(route, "path", str(route)))
+    return paths
+
+
+# Listing path -> (query parameter carrying the slug, display page it redirects to).
+_SLUG_REDIRECTS: dict[str, tuple[str, str]] = {
+    "/the-list": ("slug", "/people-display/"),
+    "/theories": ("slug", "/theory-display/"),
+    "/sources": ("source", "/sources-individual/"),
+}
+
+
+# Slugs are normally `[a-z0-9-]`, which needs no percent-encoding.
+_SAFE_SLUG = re.compile(r"\A[a-z0-9\-]+\Z").match
+
+
+def _slug_redirect_response(query_params: QueryParams, param_name: str, target_path: str) -> RedirectResponse | None:
+    slug = (query_params.get(param_name) or "").strip().lower()
+    if not slug:
+        return None
+    safe_slug = slug if _SAFE_SLUG(slug) else quote(slug, safe="-")
+    return RedirectResponse(url=f"{target_path}?slug={safe_slug}", status_code=307)
+
+
+class _SlugRedirect:
+    """Wraps a listing mount so `?<param>=<slug>` on its root redirects to the display page."""
+
+    def __init__(self, app, *, param_name: str, target_path: str):
+        self.app = app
+        self.param_name = param_name
+        self.target_path = target_path
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            path = scope["path"]
+            root_path = scope.get("root_path", "")
+            if root_path and path.startswith(root_path):
+                path = path[len(root_path):]
+            if path in ("", "/"):
+                query_params = QueryParams(scope.get("query_string", b""))
+                response = _slug_redirect_response(query_params, self.param_name, self.target_path)
+                if response is not None:
+                    return await response(scope, receive, send)
+        await self.app(scope, receive, send)
+
+
+def _add_listing_root_route(listing_path: str, param_name: str, target_path: str) -> None:
+    # The bare path never matches the mount; redirect it in one hop (to the display page or to `path/`).
+    async def listing_root(request: Request) -> RedirectResponse:
+        response = _slug_redirect_response(request.query_params, param_name, target_path)
+        if response is not None:
+            return response
+        query = request.url.query
+        return RedirectResponse(url=f"{listing_path}/?{query}" if query else f"{listing_path}/", status_code=307)
+
+    app.add_route(listing_path, listing_root, methods=["GET", "HEAD"], include_in_schema=False)
+
+
+for listing_path, (param_name, target_path) in _SLUG_REDIRECTS.items():
+    _add_listing_root_route(listing_path, param_name, target_path)
+
+# OAuth client config and the session secret, resolved together (Secret Manager reads run in parallel).
+_SECRETS = resolve_secrets(
+    ["GOOGLE_CLIENT_ID", "GOOGLE_CLIENT_SECRET", "SESSION_SECRET"],
+    defaults={"SESSION_SECRET": "dev-session-secret"},
+)
+GOOGLE_CLIENT_ID     = _SECRETS["GOOGLE_CLIENT_ID"]
+GOOGLE_CLIENT_SECRET = _SECRETS["GOOGLE_CLIENT_SECRET"]
 
 register_oauth_provider(
     name="google",
@@ -194,19 +641,82 @@ add_login_snippet_route(app, provider_name="google")
 
 # --- Static assets
 os.makedirs("images", exist_ok=True)
-FAVICON_FILE = Path("images") / "The-list-logo2.png"
+STATIC_DIR = "images"
+FAVICON_FILE = Path(STATIC_DIR) / "The-list-logo2.png"
+STATIC_CACHE_CONTROL = "public, max-age=604800"
+STATIC_CACHE_ITEM_MAX = 1024 * 1024
+
+
+def _load_static_cache(directory: str) -> dict[str, tuple[bytes, str, dict[str, str]]]:
+    """Read small shipped assets once: relative path -> (payload, content type, response headers)."""
+    cache: dict[str, tuple[bytes, str, dict[str, str]]] = {}
+    for root, _, file_names in os.walk(directory):
+        for file_name in file_names:
+            full_path = os.path.join(root, file_name)
+            try:
+                stat = os.stat(full_path)
+                if stat.st_size > STATIC_CACHE_ITEM_MAX:
+                    continue
+                with open(full_path, "rb") as handle:
+                    payload = handle.read()
+            except OSError:
+                continue
+            etag = _weak_etag(stat.st_size, datetime.fromtimestamp(stat.st_mtime, timezone.utc))
+            headers = {"Cache-Control": STATIC_CACHE_CONTROL, "ETag": etag}
+            content_type = _guess_media_type(os.path.splitext(file_name)[1].lower())
+            cache[os.path.normpath(os.path.relpath(full_path, directory))] = (payload, content_type, headers)
+    return cache
+
+
+# The assets ship with the image, so they are read into memory once at import.
+_STATIC_CACHE = _load_static_cache(STATIC_DIR)
+
+
+class _CachedStaticFiles(StaticFiles):
+    """StaticFiles that answers from `_STATIC_CACHE` first; large or unknown files still hit the disk."""
+
+    async def get_response(self, path: str, scope) -> Response:
+        # Non-GET/HEAD requests fall through so StaticFiles still answers them with 405.
+        entry = _STATIC_CACHE.get(path) if scope["method"] in ("GET", "HEAD") else None
+        if entry is None:
+            return await super().get_response(path, scope)
+        payload, content_type, headers = entry
+        if _etag_matches(Headers(scope=scope).get("if-none-match"), headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        return Response(payload, media_type=content_type, headers=headers)
+
+
 app.mount(
     "/images",
-    StaticFiles(directory="images", check_dir=False),
+    _CachedStaticFiles(directory=STATIC_DIR, check_dir=False),
     name="images",
 )
 
 
+def _favicon_etag() -> str:
+    try:
+        stat = FAVICON_FILE.stat()
+    except OSError:
+        return ""
+    return _weak_etag(stat.st_size, datetime.fromtimestamp(stat.st_mtime, timezone.utc))
+
+
+# Resolved once at import, like the cached assets above.
+FAVICON_ETAG = _favicon_etag()
+FAVICON_HEADERS = {"Cache-Control": STATIC_CACHE_CONTROL, "ETag": FAVICON_ETAG}
+FAVICON_CACHED = _STATIC_CACHE.get(os.path.normpath(os.path.relpath(FAVICON_FILE, STATIC_DIR)))
+
+
 @app.get("/favicon.ico")
-async def favicon() -> FileResponse:
-    if FAVICON_FILE.exists():
-        return FileResponse(FAVICON_FILE)
-    raise HTTPException(status_code=404)
+async def favicon(request: Request) -> Response:
+    if not FAVICON_ETAG:
+        raise HTTPException(status_code=404)
+    if _etag_matches(request.headers.get("if-none-match"), FAVICON_ETAG):
+        return Response(status_code=304, headers=FAVICON_HEADERS)
+    if FAVICON_CACHED is not None:
+        payload, content_type, _ = FAVICON_CACHED
+        return Response(payload, media_type=content_type, headers=FAVICON_HEADERS)
+    return FileResponse(FAVICON_FILE, headers=FAVICON_HEADERS)
 
 
 @app.get("/media/{blob_path:path}")
@@ -214,35 +724,66 @@ async def media_blob(blob_path: str, request: Request) -> Response:
     normalized = (blob_path or "").strip().lstrip("/")
     if not normalized:
         raise HTTPException(status_code=404)
+    try:
+        return await _serve_media(normalized, request)
+    except _StaleMediaMetadata:
+        pass
+    # The blob was overwritten within the metadata TTL; retry once against fresh metadata.
+    try:
+        return await _serve_media(normalized, request)
+    except _StaleMediaMetadata:
+        raise HTTPException(status_code=500, detail="Media fetch failed")
 
+
+async def _serve_media(normalized: str, request: Request) -> Response:
     # Versioned URLs (`?v=...`) are content-addressed from app data, so we can cache
-    # aggressively and skip metadata round-trips.
+    # aggressively; only a payload-cache miss still needs a GCS metadata lookup.
     version_token = str(request.query_params.get("v", "")).strip()
-    if version_token:
-        guessed_type = mimetypes.guess_type(normalized)[0]
+    if version_token and _MEDIA_VERSION_TOKEN_RE.fullmatch(version_token):
+        # The version token identifies the bytes, so it doubles as a strong ETag and a
+        # matching revalidation never needs to reach GCS.
+        etag = _quote_etag(version_token)
+        headers = {**MEDIA_VERSIONED_HEADERS, "ETag": etag} if etag else MEDIA_VERSIONED_HEADERS
+        if _is_not_modified(request, etag=etag, updated_at=None):
+            return _not_modified_response(request, etag, headers)
+        media_type = _guess_media_type(os.path.splitext(normalized)[1].lower())
+        size = generation = None
         try:
-            payload = download_bytes(normalized)
+            if "range" in request.headers:
+                _, _, _, size, generation = await _media_metadata(normalized)
+            else:
+                # Small immutable payloads are served from memory; larger ones stream from GCS.
+                payload = await _media_payload(normalized, version_token)
+                if payload is not None:
+                    return await _media_payload_response(
+                        request, normalized, version_token, payload, media_type=media_type, headers=headers
+                    )
         except FileNotFoundError:
             raise HTTPException(status_code=404)
         except Exception:
             raise HTTPException(status_code=500, detail="Media fetch failed")
-        return Response(
-            content=payload,
-            media_type=guessed_type or "application/octet-stream",
-            headers={"Cache-Control": MEDIA_CACHE_CONTROL_VERSIONED},
+        return await _stream_media(
+            request,
+            normalized,
+            media_type=media_type,
+            headers=headers,
+            size=size,
+            generation=generation,
         )
 
     try:
-        content_type, blob_etag, blob_updated_at = blob_http_metadata(normalized)
+        content_type, blob_etag, blob_updated_at, blob_size, blob_generation = await _media_metadata(normalized)
     except FileNotFoundError:
         raise HTTPException(status_code=404)
     except Exception:
         raise HTTPException(status_code=500, detail="Media fetch failed")
 
-    etag = _quote_etag(blob_etag)
+    # GCS etags are strong and free; size+mtime only stands in when a blob has none.
+    etag = _quote_etag(blob_etag) or _weak_etag(blob_size, blob_updated_at)
     last_modified = _format_http_date(blob_updated_at)
     headers = {
         "Cache-Control": MEDIA_CACHE_CONTROL_REVALIDATE,
+        "Vary": "Accept-Encoding",
     }
     if etag:
         headers["ETag"] = etag
@@ -250,52 +791,79 @@ async def media_blob(blob_path: str, request: Request) -> Response:
         headers["Last-Modified"] = last_modified
 
     if _is_not_modified(request, etag=etag, updated_at=blob_updated_at):
-        return Response(status_code=304, headers=headers)
-
-    try:
-        payload = download_bytes(normalized)
-    except FileNotFoundError:
-        raise HTTPException(status_code=404)
-    except Exception:
-        raise HTTPException(status_code=500, detail="Media fetch failed")
+        return _not_modified_response(request, etag, headers)
+
+    media_type = content_type or "application/octet-stream"
+    if (
+        etag
+        and "range" not in request.headers
+        and _is_compressible(media_type)
+        and _accepts_gzip(request.headers.get("accept-encoding", ""))
+    ):
+        # Small text media is buffered (keyed by its etag) so it can be served gzip-encoded.
+        try:
+            payload = await _media_payload(normalized, etag, blob_size)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404)
+        except Exception:
+            raise HTTPException(status_code=500, detail="Media fetch failed")
+        if payload is not None:
+            return await _media_payload_response(
+                request, normalized, etag, payload, media_type=media_type, headers=headers
+            )
 
-    return Response(content=payload, media_type=content_type or "application/octet-stream", headers=headers)
+    return await _stream_media(
+        request,
+        normalized,
+        media_type=media_type,
+        headers=headers,
+        size=blob_size,
+        generation=blob_generation,
+    )
 
 # --- Simple pages
-home_app       = make_home_app()
-profile_app    = make_profile_app()
-the_list_app   = make_the_list_app()
-theories_app   = make_theories_app()
-sources_app    = make_sources_app()
-sources_create_app = make_sources_create_app()
-sources_individual_app = make_sources_individual_app()
-unsorted_files_app = make_unsorted_files_app()
-people_display_app = make_people_display_app()
-theory_display_app = make_theory_display_app()
-people_create_app = make_people_create_app()
-theory_create_app = make_theory_create_app()
-the_list_review_app = make_review_display_app()
-admin_app      = make_admin_app()
-privileges_app = make_privileges_app()
+# Mount path -> (module, factory). Each page is imported and built on its first request;
+# only the login page at `/` is built eagerly since it is the default landing.
+_LAZY_APPS: dict[str, tuple[str, str]] = {
+    "/app": ("src.pages.ui_home", "make_home_app"),
+    "/profile": ("src.pages.ui_profile", "make_profile_app"),
+    "/the-list": ("src.pages.the_list.app_the_list", "make_the_list_app"),
+    "/theories": ("src.pages.theories.app_theories", "make_theories_app"),
+    "/sources": ("src.pages.sources_list.app_sources", "make_sources_app"),
+    "/source-create": ("src.pages.sources_list.app_sources_create", "make_sources_create_app"),
+    "/sources-individual": ("src.pages.sources_individual.app_sources_individual", "make_sources_individual_app"),
+    "/unsorted-files": ("src.pages.unsorted_files.app_unsorted_files", "make_unsorted_files_app"),
+    "/people-display": ("src.pages.people_display.app_people_display", "make_people_display_app"),
+    "/theory-display": ("src.pages.theory_display.app_theory_display", "make_theory_display_app"),
+    "/people-create": ("src.pages.people_display.app_people_create", "make_people_create_app"),
+    "/theory-create": ("src.pages.theory_display.app_theory_create", "make_theory_create_app"),
+    "/the-list-review": ("src.pages.review_display.app_review_display", "make_review_display_app"),
+    "/admin": ("src.pages.admin.app_admin", "make_admin_app"),
+    "/privileges": ("src.pages.privileges.app_privileges", "make_privileges_app"),
+}
 login_page     = make_login_page()
 
 # Optional: session secret via secret manager (fallback default set in bootstrap)
-session_secret = get_secret("SESSION_SECRET", default="dev-session-secret")
-mount_gradio_app(app, home_app,     "/app", secret_key=session_secret)
-mount_gradio_app(app, profile_app,   "/profile", secret_key=session_secret)
-mount_gradio_app(app, the_list_app,  "/the-list", secret_key=session_secret)
-mount_gradio_app(app, theories_app,  "/theories", secret_key=session_secret)
-mount_gradio_app(app, sources_app,  "/sources", secret_key=session_secret)
-mount_gradio_app(app, sources_create_app,  "/source-create", secret_key=session_secret)
-mount_gradio_app(app, sources_individual_app,  "/sources-individual", secret_key=session_secret)
-mount_gradio_app(app, unsorted_files_app,  "/unsorted-files", secret_key=session_secret)
-mount_gradio_app(app, people_display_app,  "/people-display", secret_key=session_secret)
-mount_gradio_app(app, theory_display_app,  "/theory-display", secret_key=session_secret)
-mount_gradio_app(app, people_create_app,  "/people-create", secret_key=session_secret)
-mount_gradio_app(app, theory_create_app,  "/theory-create", secret_key=session_secret)
-mount_gradio_app(app, the_list_review_app,  "/the-list-review", secret_key=session_secret)
-mount_gradio_app(app, admin_app,         "/admin", secret_key=session_secret)
-mount_gradio_app(app, privileges_app,   "/privileges", secret_key=session_secret)
+session_secret = _SECRETS["SESSION_SECRET"]
+# All page mounts share one route entry, so dispatch is a dict lookup on the first path segment.
+page_mounts = MountTable()
+for mount_path, (module_name, factory_name) in _LAZY_APPS.items():
+    slug_redirect = _SLUG_REDIRECTS.get(mount_path)
+    wrapper = (
+        partial(_SlugRedirect, param_name=slug_redirect[0], target_path=slug_redirect[1])
+        if slug_redirect
+        else None
+    )
+    mount_lazy_gradio_app(
+        app,
+        module_name,
+        factory_name,
+        mount_path,
+        session_middleware=False,
+        wrapper=wrapper,
+        router=page_mounts,
+    )
+app.router.routes.append(page_mounts)
 
 
 @app.get("/people")
@@ -305,3 +873,7 @@ async def legacy_people_redirect() -> RedirectResponse:
 
 
 gr.mount_gradio_app(app, login_page, "/")
+
+# One SessionMiddleware for every mount (one cookie verify per request); added last so it
+# wraps all of the per-mount auth middleware.
+add_session_middleware(app, session_secret)
@@ -546,20 +546,19 @@ CREATE INDEX IF NOT EXISTS idx_sources_change_proposals_reviewer_user_id
 CREATE INDEX IF NOT EXISTS idx_sources_change_events_proposal
   ON app.sources_change_events(proposal_id);
 
-CREATE INDEX IF NOT EXISTS idx_unsorted_files_created_at
-  ON app.unsorted_files(created_at);
+CREATE INDEX IF NOT EXISTS idx_unsorted_files_created_at_brin
+  ON app.unsorted_files USING BRIN (created_at) WITH (pages_per_range = 16);
 
 CREATE INDEX IF NOT EXISTS idx_unsorted_files_uploaded_by
   ON app.unsorted_files(uploaded_by_user_id);
 
-CREATE INDEX IF NOT EXISTS idx_unsorted_actions_file_id
-  ON app.unsorted_file_actions(unsorted_file_id);
+CREATE INDEX IF NOT EXISTS idx_unsorted_actions_actor_recent
+  ON app.unsorted_file_actions(actor_user_id, unsorted_file_id, updated_at DESC)
+  INCLUDE (action_type, source_slug);
 
-CREATE INDEX IF NOT EXISTS idx_unsorted_actions_actor
-  ON app.unsorted_file_actions(actor_user_id);
-
-CREATE INDEX IF NOT EXISTS idx_unsorted_actions_type
-  ON app.unsorted_file_actions(action_type);
+CREATE INDEX IF NOT EXISTS idx_unsorted_actions_create_new_source
+  ON app.unsorted_file_actions(unsorted_file_id, updated_at DESC)
+  WHERE lower(action_type) = 'create_new_source';
 
 CREATE INDEX IF NOT EXISTS idx_unsorted_push_proposals_file_source
   ON app.unsorted_file_push_proposals(unsorted_file_id, source_id);
@@ -2,17 +2,27 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
+import hashlib
 import io
 import json
+import logging
+import multiprocessing
+import os
 import re
 import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path, PurePosixPath
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator, NamedTuple
 from urllib.parse import unquote, urlsplit
 
 import requests
-from PIL import Image, ImageOps
+from PIL import Image, ImageOps, features
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from sqlalchemy import text
 
 try:
@@ -21,6 +31,12 @@ except ModuleNotFoundError:  # pragma: no cover
     def load_dotenv(*_args, **_kwargs):  # type: ignore[no-redef]
         return False
 
+try:
+    from tqdm import tqdm
+except ModuleNotFoundError:  # pragma: no cover
+    def tqdm(iterable, **_kwargs):  # type: ignore[no-redef]
+        return iterable
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
@@ -29,10 +45,31 @@ from src.db import session_scope
 from src.gcs_storage import bucket_name as default_bucket_name
 from src.gcs_storage import media_path, storage_client
 
+logger = logging.getLogger(__name__)
+
 TARGET_WIDTH = 360
 TARGET_HEIGHT = 270
 TARGET_RATIO = TARGET_WIDTH / TARGET_HEIGHT
+EXIF_ORIENTATION_TAG = 0x0112
+TARGET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+MIGRATOR_VERSION = "1"
+# `-360x270` plus the optional content digest a previous run appended.
+_TARGET_STEM_SUFFIX_RE = re.compile(r"-360x270(?:-[0-9a-f]{8})?$")
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_TARGET_URL_RE = re.compile(r"-360x270(?:-[0-9a-f]{8})?\.(?:png|webp|avif)$")
 DEFAULT_MEDIA_PREFIX = "the-list/uploads"
+DEFAULT_CONCURRENCY = min(32, 2 * (os.cpu_count() or 1))
+DEFAULT_OUTPUT_FORMAT = "webp"
+DEFAULT_TRANSFORM_PROCESSES = os.cpu_count() or 1
+# name -> (PIL format, content type, blob suffix, save options)
+OUTPUT_FORMATS: dict[str, tuple[str, str, str, dict[str, Any]]] = {
+    "webp": ("WEBP", "image/webp", ".webp", {"quality": 82, "method": 4}),
+    "png": ("PNG", "image/png", ".png", {"compress_level": 6}),
+    "avif": ("AVIF", "image/avif", ".avif", {"quality": 60}),
+}
+
+# Same default `Image.thumbnail` uses: box-reduce first while staying >= 2x the target size.
+RESIZE_REDUCING_GAP = 2.0
 
 try:
     LANCZOS = Image.Resampling.LANCZOS
@@ -52,6 +89,7 @@ class Stats:
     skipped_no_blob: int = 0
     external_downloads: int = 0
     reused_conversions: int = 0
+    reused_transforms: int = 0
     errors: int = 0
 
     def as_dict(self) -> dict[str, int]:
@@ -66,12 +104,13 @@ class Stats:
             "skipped_no_blob": self.skipped_no_blob,
             "external_downloads": self.external_downloads,
             "reused_conversions": self.reused_conversions,
+            "reused_transforms": self.reused_transforms,
             "errors": self.errors,
         }
 
 
 def _slugify(value: str) -> str:
-    normalized = re.sub(r"[^a-z0-9]+", "-", (value or "").strip().lower())
+    normalized = _SLUG_RE.sub("-", (value or "").strip().lower())
     return normalized.strip("-") or "item"
 
 
@@ -121,10 +160,36 @@ def _center_crop_box(width: int, height: int, target_ratio: float) -> tuple[int,
     return left, top, right, bottom
 
 
-def _transform_to_target_png(source_bytes: bytes) -> tuple[bytes, int, int]:
+def _has_transparency(image: Image.Image) -> bool:
+    return image.mode == "RGBA" and image.getchannel("A").getextrema()[0] < 255
+
+
+def _source_dimensions(source_bytes: bytes) -> tuple[int, int] | None:
+    """
+    (width, height) as displayed, read from the header only: `Image.open` is lazy and the JPEG
+    plugin gets the size from the SOF marker, so no pixels are decoded. None if unreadable.
+    """
+    try:
+        with Image.open(io.BytesIO(source_bytes)) as image_raw:
+            width, height = image_raw.size
+            if image_raw.getexif().get(EXIF_ORIENTATION_TAG) in {5, 6, 7, 8}:
+                width, height = height, width
+            return width, height
+    except Exception:  # noqa: BLE001
+        return None
+
+
+def _transform_to_target(source_bytes: bytes, output_format: str) -> tuple[bytes, str, int, int]:
+    """Returns: (encoded_bytes, output_format_used, source_width, source_height)"""
     with Image.open(io.BytesIO(source_bytes)) as image_raw:
+        width, height = image_raw.size
+        if image_raw.format == "JPEG":
+            # Let libjpeg decode at 1/2..1/8 scale while staying >= 2x the target, instead of
+            # materializing the full-resolution bitmap only to shrink it.
+            image_raw.draft("RGB", (TARGET_WIDTH * 2, TARGET_HEIGHT * 2))
+        if image_raw.getexif().get(EXIF_ORIENTATION_TAG) in {5, 6, 7, 8}:
+            width, height = height, width
         image = ImageOps.exif_transpose(image_raw)
-        width, height = image.size
         if width <= 0 or height <= 0:
             raise ValueError("Invalid source dimensions.")
 
@@ -132,13 +197,25 @@ def _transform_to_target_png(source_bytes: bytes) -> tuple[bytes, int, int]:
             has_alpha = "A" in image.getbands()
             image = image.convert("RGBA" if has_alpha else "RGB")
 
-        crop_box = _center_crop_box(width, height, TARGET_RATIO)
-        cropped = image.crop(crop_box)
-        resized = cropped.resize((TARGET_WIDTH, TARGET_HEIGHT), LANCZOS)
+        # Crop in decoded pixels; `width`/`height` keep reporting the original source size.
+        # Passing the crop as `box` resamples straight from the source (no cropped copy; a
+        # matching aspect ratio gives the full frame), and `reducing_gap` lets Pillow shrink by
+        # an integer factor with `reduce()` before the Lanczos pass when the source is much larger.
+        crop_box = _center_crop_box(*image.size, TARGET_RATIO)
+        resized = image.resize(
+            (TARGET_WIDTH, TARGET_HEIGHT), LANCZOS, box=crop_box, reducing_gap=RESIZE_REDUCING_GAP
+        )
+
+        # Real transparency keeps the lossless PNG path; an opaque alpha channel is just dropped.
+        if _has_transparency(resized):
+            output_format = "png"
+        elif resized.mode == "RGBA":
+            resized = resized.convert("RGB")
 
+        pil_format, _content_type, _suffix, save_options = OUTPUT_FORMATS[output_format]
         output = io.BytesIO()
-        resized.save(output, format="PNG", optimize=True)
-        return output.getvalue(), width, height
+        resized.save(output, format=pil_format, **save_options)
+        return output.getvalue(), output_format, width, height
 
 
 def _target_blob_name(
@@ -146,19 +223,39 @@ def _target_blob_name(
     source_blob: str | None,
     fallback_prefix: str,
     fallback_key: str,
+    content_digest: str,
+    suffix: str = ".png",
 ) -> str:
+    # The content digest makes every distinct output its own URL, so uploads can be cached as immutable.
+    target_suffix = f"-360x270-{content_digest[:8]}{suffix}"
     if source_blob:
         source_path = PurePosixPath(source_blob)
-        stem = source_path.stem
-        if not stem.endswith("-360x270"):
-            stem = f"{stem}-360x270"
-        filename = f"{stem}.png"
+        stem = _TARGET_STEM_SUFFIX_RE.sub("", source_path.stem)
+        filename = f"{stem}{target_suffix}"
         parent = "" if str(source_path.parent) == "." else str(source_path.parent)
         return f"{parent}/{filename}".lstrip("/") if parent else filename
 
     prefix = fallback_prefix.strip("/") or DEFAULT_MEDIA_PREFIX
     key = _slugify(fallback_key)
-    return f"{prefix}/{key}-360x270.png"
+    return f"{prefix}/{key}{target_suffix}"
+
+
+_THREAD_LOCAL = threading.local()
+
+
+def _http_session() -> requests.Session:
+    # One keep-alive session per worker thread: external fetches reuse connections
+    # instead of paying a TCP/TLS handshake each (requests.Session is not shared across threads).
+    session = getattr(_THREAD_LOCAL, "http_session", None)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _THREAD_LOCAL.http_session = session
+    return session
 
 
 def _download_bytes(
@@ -174,365 +271,432 @@ def _download_bytes(
     """
     blob_path = _extract_blob_path(url_value)
     if blob_path:
-        bucket = bucket_cache.setdefault(bucket_value, client.bucket(bucket_value))
+        # `_migrate_scope` pre-populates the cache, so workers don't build a Bucket per row.
+        bucket = bucket_cache.get(bucket_value) or client.bucket(bucket_value)
         blob = bucket.blob(blob_path)
         payload = blob.download_as_bytes(client=client)
         return payload, blob.content_type, blob_path, False
 
     parsed = urlsplit(str(url_value or "").strip())
     if parsed.scheme in {"http", "https"} and allow_external_downloads:
-        response = requests.get(str(url_value), timeout=30)
+        response = _http_session().get(str(url_value), timeout=30)
         response.raise_for_status()
         return response.content, response.headers.get("content-type"), None, True
 
     return None, None, None, False
 
 
-def _load_rows(session, *, include_people: bool, include_sources: bool) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-    people_rows: list[dict[str, Any]] = []
-    sources_rows: list[dict[str, Any]] = []
-
-    if include_people:
-        people_rows = [
-            dict(row)
-            for row in session.execute(
-                text(
-                    """
-                    SELECT
-                        id,
-                        slug,
-                        bucket,
-                        COALESCE(image_url, '') AS image_url
-                    FROM app.people_cards
-                    ORDER BY id ASC
-                    """
-                )
-            ).mappings()
-        ]
-
-    if include_sources:
-        sources_rows = [
-            dict(row)
-            for row in session.execute(
-                text(
-                    """
-                    SELECT
-                        id,
-                        slug,
-                        bucket,
-                        folder_prefix,
-                        COALESCE(cover_media_url, '') AS cover_media_url
-                    FROM app.sources_cards
-                    ORDER BY id ASC
-                    """
-                )
-            ).mappings()
-        ]
-
-    return people_rows, sources_rows
-
-
-def _iter_limited(rows: list[dict[str, Any]], *, offset: int, limit: int | None) -> Iterable[dict[str, Any]]:
-    sliced = rows[offset:] if offset > 0 else rows
-    if limit is not None and limit >= 0:
-        return sliced[:limit]
-    return sliced
-
-
-def _migrate_people(
+_PEOPLE_ROWS_SQL = """
+    SELECT
+        id,
+        slug,
+        bucket,
+        image_url AS url,
+        NULL AS folder_prefix
+    FROM app.people_cards
+"""
+_SOURCES_ROWS_SQL = """
+    SELECT
+        id,
+        slug,
+        bucket,
+        cover_media_url AS url,
+        folder_prefix
+    FROM app.sources_cards
+"""
+ROWS_FETCH_SIZE = 500
+
+
+class CardRow(NamedTuple):
+    """One card row, normalized once when read: stripped strings and the bucket already resolved."""
+
+    id: int
+    slug: str
+    bucket: str
+    url: str
+    folder_prefix: str
+
+
+def _iter_rows(
     session,
+    select_sql: str,
     *,
-    rows: list[dict[str, Any]],
-    apply_changes: bool,
-    commit_every: int,
-    allow_external_downloads: bool,
-    skip_already_target_size: bool,
-    client,
-    bucket_cache: dict[str, Any],
-) -> tuple[Stats, list[dict[str, str]]]:
-    stats = Stats()
-    updates_preview: list[dict[str, str]] = []
-    converted_cache: dict[tuple[str, str], tuple[str, int, int]] = {}
-
-    for row in rows:
-        stats.scanned += 1
-        row_id = int(row["id"])
-        slug = str(row.get("slug") or "").strip()
-        current_url = str(row.get("image_url") or "").strip()
-        row_bucket = _resolve_bucket_name(row.get("bucket"))
-
-        if not current_url:
-            stats.skipped_empty += 1
-            continue
-        if _is_placeholder_image(current_url):
-            stats.skipped_placeholder += 1
-            continue
-
-        cache_key = (row_bucket, current_url)
-        if cache_key in converted_cache:
-            new_url, src_w, src_h = converted_cache[cache_key]
-            stats.reused_conversions += 1
-            if new_url != current_url:
-                updates_preview.append(
-                    {
-                        "scope": "people",
-                        "id": str(row_id),
-                        "slug": slug,
-                        "from": current_url,
-                        "to": new_url,
-                        "source_size": f"{src_w}x{src_h}",
-                    }
-                )
-                if apply_changes:
-                    session.execute(
-                        text(
-                            """
-                            UPDATE app.people_cards
-                            SET image_url = :image_url,
-                                updated_at = now()
-                            WHERE id = :id
-                            """
-                        ),
-                        {"id": row_id, "image_url": new_url},
-                    )
-                    stats.updated_rows += 1
-                    if commit_every > 0 and stats.updated_rows % commit_every == 0:
-                        session.commit()
-            continue
+    offset: int,
+    limit: int | None,
+    after_id: int,
+) -> Iterator[CardRow]:
+    """
+    Stream one card table through a server-side cursor with paging done in SQL.
+    The cursor only lives until the caller's next commit, so consume it fully before committing.
+    """
+    statement = text(
+        f"""
+        {select_sql}
+        WHERE id > :after_id
+        ORDER BY id ASC
+        LIMIT :limit OFFSET :offset
+        """
+    ).execution_options(stream_results=True, yield_per=ROWS_FETCH_SIZE)
+    params = {
+        "after_id": after_id,
+        "limit": limit if limit is not None and limit >= 0 else None,
+        "offset": offset,
+    }
+    for row_id, slug, bucket, url, folder_prefix in session.execute(statement, params):
+        yield CardRow(
+            id=int(row_id),
+            slug=(slug or "").strip(),
+            bucket=_resolve_bucket_name(bucket),
+            url=(url or "").strip(),
+            folder_prefix=(folder_prefix or "").strip(),
+        )
 
-        try:
-            payload, _content_type, source_blob, used_external = _download_bytes(
-                url_value=current_url,
-                bucket_value=row_bucket,
-                allow_external_downloads=allow_external_downloads,
-                client=client,
-                bucket_cache=bucket_cache,
-            )
-        except Exception as exc:  # noqa: BLE001
-            stats.errors += 1
-            print(f"[people:{row_id}] download failed: {exc}")
-            continue
 
-        if payload is None:
-            stats.skipped_unhandled_url += 1
-            continue
-        if used_external:
-            stats.external_downloads += 1
+@dataclass
+class RowOutcome:
+    new_url: str | None = None
+    src_w: int = 0
+    src_h: int = 0
+    used_external: bool = False
+    reused_transform: bool = False
+    already_target: bool = False
+    unhandled: bool = False
+    error: str | None = None
+
+
+TRANSFORM_CACHE_MAX_ENTRIES = 4096
+_TRANSFORM_CACHE_LOCK = threading.Lock()
+# (sha256 of source bytes, output format) -> (encoded bytes, format used, source width, source height), LRU order.
+_TRANSFORM_CACHE: OrderedDict[tuple[str, str], tuple[bytes, str, int, int]] = OrderedDict()
+# (bucket, blob) targets written (or being written) during this run -> that upload's outcome.
+_UPLOADED_BLOBS: dict[tuple[str, str], Future] = {}
+
+
+def _init_transform_worker() -> None:
+    # Register Pillow's codec plugins once per worker process instead of on its first image.
+    Image.init()
+
+
+def _cached_transform(
+    payload: bytes,
+    source_digest: str,
+    output_format: str,
+    transform_pool: Executor | None = None,
+) -> tuple[tuple[bytes, str, int, int], bool]:
+    """
+    Transform `payload`, reusing the result for byte-identical sources reached via different URLs.
+    With `transform_pool`, the decode/resize/encode runs in a worker process so it isn't serialized
+    by the GIL; the calling I/O thread just waits for the result.
+    """
+    key = (source_digest, output_format)
+    with _TRANSFORM_CACHE_LOCK:
+        cached = _TRANSFORM_CACHE.get(key)
+        if cached is not None:
+            _TRANSFORM_CACHE.move_to_end(key)
+            return cached, True
+    if transform_pool is not None:
+        transformed = transform_pool.submit(_transform_to_target, payload, output_format).result()
+    else:
+        transformed = _transform_to_target(payload, output_format)
+    with _TRANSFORM_CACHE_LOCK:
+        _TRANSFORM_CACHE[key] = transformed
+        while len(_TRANSFORM_CACHE) > TRANSFORM_CACHE_MAX_ENTRIES:
+            _TRANSFORM_CACHE.popitem(last=False)
+    return transformed, False
 
-        try:
-            migrated_png, src_w, src_h = _transform_to_target_png(payload)
-        except Exception as exc:  # noqa: BLE001
-            stats.errors += 1
-            print(f"[people:{row_id}] transform failed: {exc}")
-            continue
-
-        if skip_already_target_size and src_w == TARGET_WIDTH and src_h == TARGET_HEIGHT:
-            stats.skipped_already_target += 1
-            converted_cache[cache_key] = (current_url, src_w, src_h)
-            continue
-
-        target_blob = _target_blob_name(
-            source_blob=source_blob,
-            fallback_prefix=f"{DEFAULT_MEDIA_PREFIX}/{_slugify(slug)}",
-            fallback_key=f"people-{row_id}-{slug}",
-        )
-        new_url = media_path(target_blob)
 
-        if apply_changes:
-            try:
-                upload_bucket = bucket_cache.setdefault(row_bucket, client.bucket(row_bucket))
-                upload_blob = upload_bucket.blob(target_blob)
-                upload_blob.cache_control = "public, max-age=3600"
-                upload_blob.upload_from_string(migrated_png, content_type="image/png")
-            except Exception as exc:  # noqa: BLE001
-                stats.errors += 1
-                print(f"[people:{row_id}] upload failed: {exc}")
-                continue
+def _claim_upload(row_bucket: str, target_blob: str) -> tuple[Future, bool]:
+    """Return the upload future for a target blob and whether the caller owns (must perform) it."""
+    with _TRANSFORM_CACHE_LOCK:
+        upload = _UPLOADED_BLOBS.get((row_bucket, target_blob))
+        if upload is not None:
+            return upload, False
+        upload = _UPLOADED_BLOBS[(row_bucket, target_blob)] = Future()
+        return upload, True
 
-            try:
-                session.execute(
-                    text(
-                        """
-                        UPDATE app.people_cards
-                        SET image_url = :image_url,
-                            updated_at = now()
-                        WHERE id = :id
-                        """
-                    ),
-                    {"id": row_id, "image_url": new_url},
-                )
-                stats.updated_rows += 1
-                if commit_every > 0 and stats.updated_rows % commit_every == 0:
-                    session.commit()
-            except Exception as exc:  # noqa: BLE001
-                stats.errors += 1
-                print(f"[people:{row_id}] update failed: {exc}")
-                continue
 
-        stats.migrated += 1
-        converted_cache[cache_key] = (new_url, src_w, src_h)
-        updates_preview.append(
-            {
-                "scope": "people",
-                "id": str(row_id),
-                "slug": slug,
-                "from": current_url,
-                "to": new_url,
-                "source_size": f"{src_w}x{src_h}",
-            }
+def _release_upload(row_bucket: str, target_blob: str, upload: Future, exc: BaseException) -> None:
+    # Rows already waiting on this upload see the failure; a later row gets to retry it.
+    with _TRANSFORM_CACHE_LOCK:
+        if _UPLOADED_BLOBS.get((row_bucket, target_blob)) is upload:
+            del _UPLOADED_BLOBS[(row_bucket, target_blob)]
+    upload.set_exception(exc)
+
+
+def _process_row(
+    *,
+    current_url: str,
+    row_bucket: str,
+    fallback_prefix: str,
+    fallback_key: str,
+    apply_changes: bool,
+    allow_external_downloads: bool,
+    skip_already_target_size: bool,
+    output_format: str,
+    client,
+    bucket_cache: dict[str, Any],
+    transform_pool: Executor | None = None,
+) -> RowOutcome:
+    """
+    Download, transform and (with --apply) upload one image. Runs on worker threads,
+    so it never touches the DB session; `bucket_cache` must already hold `row_bucket`.
+    """
+    try:
+        payload, _content_type, source_blob, used_external = _download_bytes(
+            url_value=current_url,
+            bucket_value=row_bucket,
+            allow_external_downloads=allow_external_downloads,
+            client=client,
+            bucket_cache=bucket_cache,
+        )
+    except Exception as exc:  # noqa: BLE001
+        return RowOutcome(error=f"download failed: {exc}")
+
+    if payload is None:
+        return RowOutcome(unhandled=True)
+
+    if skip_already_target_size and _source_dimensions(payload) == (TARGET_WIDTH, TARGET_HEIGHT):
+        # Header says it's already the card size: skip decode/resize/encode entirely.
+        return RowOutcome(
+            new_url=current_url,
+            src_w=TARGET_WIDTH,
+            src_h=TARGET_HEIGHT,
+            used_external=used_external,
+            already_target=True,
         )
 
-    return stats, updates_preview
+    source_digest = hashlib.sha256(payload).hexdigest()
+    try:
+        (migrated_bytes, used_format, src_w, src_h), reused_transform = _cached_transform(
+            payload, source_digest, output_format, transform_pool
+        )
+    except Exception as exc:  # noqa: BLE001
+        return RowOutcome(used_external=used_external, error=f"transform failed: {exc}")
+
+    _pil_format, content_type, suffix, _save_options = OUTPUT_FORMATS[used_format]
+    target_blob = _target_blob_name(
+        source_blob=source_blob,
+        fallback_prefix=fallback_prefix,
+        fallback_key=fallback_key,
+        content_digest=hashlib.sha256(migrated_bytes).hexdigest(),
+        suffix=suffix,
+    )
+    new_url = media_path(target_blob)
+
+    # Uploads stay on the worker that produced the bytes: the pool already runs --concurrency
+    # of them in parallel over pooled keep-alive connections, and the row's DB update only has
+    # to wait for its own upload rather than for a whole transfer_manager batch.
+    # Rows sharing a target blob wait for the one upload instead of pointing at a blob that
+    # may never have been written.
+    if apply_changes:
+        upload, owns_upload = _claim_upload(row_bucket, target_blob)
+        try:
+            if owns_upload:
+                try:
+                    upload_blob = bucket_cache[row_bucket].blob(target_blob)
+                    upload_blob.cache_control = TARGET_CACHE_CONTROL
+                    # Lets a later run compare sources via blob metadata instead of re-downloading.
+                    upload_blob.metadata = {"src_sha256": source_digest, "migrator_version": MIGRATOR_VERSION}
+                    upload_blob.upload_from_string(migrated_bytes, content_type=content_type)
+                except BaseException as exc:
+                    _release_upload(row_bucket, target_blob, upload, exc)
+                    raise
+                upload.set_result(None)
+            else:
+                upload.result()
+        except Exception as exc:  # noqa: BLE001
+            return RowOutcome(used_external=used_external, error=f"upload failed: {exc}")
+
+    return RowOutcome(
+        new_url=new_url,
+        src_w=src_w,
+        src_h=src_h,
+        used_external=used_external,
+        reused_transform=reused_transform,
+    )
 
 
-def _migrate_sources(
+def _migrate_scope(
     session,
     *,
-    rows: list[dict[str, Any]],
+    scope: str,
+    table: str,
+    url_column: str,
+    rows: Iterable[CardRow],
+    fallback_target,
     apply_changes: bool,
     commit_every: int,
     allow_external_downloads: bool,
     skip_already_target_size: bool,
+    output_format: str,
     client,
     bucket_cache: dict[str, Any],
+    concurrency: int,
+    transform_pool: Executor | None = None,
 ) -> tuple[Stats, list[dict[str, str]]]:
+    """
+    Shared driver for both card tables. Rows with the same (bucket, url) are converted once;
+    downloads/uploads run on a thread pool (transforms too, unless `transform_pool` is given)
+    while DB updates stay on this thread (the SQLAlchemy session is not thread-safe).
+    """
     stats = Stats()
     updates_preview: list[dict[str, str]] = []
-    converted_cache: dict[tuple[str, str], tuple[str, int, int]] = {}
-
-    for row in rows:
-        stats.scanned += 1
-        row_id = int(row["id"])
-        slug = str(row.get("slug") or "").strip()
-        folder_prefix = str(row.get("folder_prefix") or "").strip()
-        current_url = str(row.get("cover_media_url") or "").strip()
-        row_bucket = _resolve_bucket_name(row.get("bucket"))
-
-        if not current_url:
-            stats.skipped_empty += 1
-            continue
-        if _is_placeholder_image(current_url):
-            stats.skipped_placeholder += 1
-            continue
-
-        cache_key = (row_bucket, current_url)
-        if cache_key in converted_cache:
-            new_url, src_w, src_h = converted_cache[cache_key]
-            stats.reused_conversions += 1
-            if new_url != current_url:
-                updates_preview.append(
-                    {
-                        "scope": "sources",
-                        "id": str(row_id),
-                        "slug": slug,
-                        "from": current_url,
-                        "to": new_url,
-                        "source_size": f"{src_w}x{src_h}",
-                    }
-                )
-                if apply_changes:
-                    session.execute(
-                        text(
-                            """
-                            UPDATE app.sources_cards
-                            SET cover_media_url = :cover_media_url,
-                                updated_at = now()
-                            WHERE id = :id
-                            """
-                        ),
-                        {"id": row_id, "cover_media_url": new_url},
-                    )
-                    stats.updated_rows += 1
-                    if commit_every > 0 and stats.updated_rows % commit_every == 0:
-                        session.commit()
-            continue
+    # One statement per batch: ids/urls travel as two arrays and are joined back row-wise.
+    update_sql = text(
+        f"""
+        UPDATE app.{table} AS c
+        SET {url_column} = v.url,
+            updated_at = now()
+        FROM UNNEST(CAST(:ids AS bigint[]), CAST(:urls AS text[])) AS v(id, url)
+        WHERE c.id = v.id
+        """
+    )
+    pending_updates: list[tuple[int, str]] = []
 
+    def _flush_updates() -> None:
+        if not pending_updates:
+            return
+        batch = list(pending_updates)
+        pending_updates.clear()
         try:
-            payload, _content_type, source_blob, used_external = _download_bytes(
-                url_value=current_url,
-                bucket_value=row_bucket,
-                allow_external_downloads=allow_external_downloads,
-                client=client,
-                bucket_cache=bucket_cache,
+            session.execute(
+                update_sql,
+                {"ids": [row_id for row_id, _ in batch], "urls": [url for _, url in batch]},
             )
+            session.commit()
+            stats.updated_rows += len(batch)
         except Exception as exc:  # noqa: BLE001
-            stats.errors += 1
-            print(f"[sources:{row_id}] download failed: {exc}")
-            continue
-
-        if payload is None:
-            stats.skipped_unhandled_url += 1
-            continue
-        if used_external:
-            stats.external_downloads += 1
-
-        try:
-            migrated_png, src_w, src_h = _transform_to_target_png(payload)
-        except Exception as exc:  # noqa: BLE001
-            stats.errors += 1
-            print(f"[sources:{row_id}] transform failed: {exc}")
-            continue
-
-        if skip_already_target_size and src_w == TARGET_WIDTH and src_h == TARGET_HEIGHT:
-            stats.skipped_already_target += 1
-            converted_cache[cache_key] = (current_url, src_w, src_h)
-            continue
-
-        fallback_prefix = folder_prefix or f"{DEFAULT_MEDIA_PREFIX}/sources/{_slugify(slug)}"
-        target_blob = _target_blob_name(
-            source_blob=source_blob,
-            fallback_prefix=fallback_prefix,
-            fallback_key=f"source-{row_id}-{slug}",
-        )
-        new_url = media_path(target_blob)
+            session.rollback()
+            stats.errors += len(batch)
+            logger.error(
+                "[%s] update of %d rows failed (ids %s..%s): %s", scope, len(batch), batch[0][0], batch[-1][0], exc
+            )
 
+    def _record(row: CardRow, current_url: str, outcome: RowOutcome) -> None:
         if apply_changes:
-            try:
-                upload_bucket = bucket_cache.setdefault(row_bucket, client.bucket(row_bucket))
-                upload_blob = upload_bucket.blob(target_blob)
-                upload_blob.cache_control = "public, max-age=3600"
-                upload_blob.upload_from_string(migrated_png, content_type="image/png")
-            except Exception as exc:  # noqa: BLE001
-                stats.errors += 1
-                print(f"[sources:{row_id}] upload failed: {exc}")
-                continue
-
-            try:
-                session.execute(
-                    text(
-                        """
-                        UPDATE app.sources_cards
-                        SET cover_media_url = :cover_media_url,
-                            updated_at = now()
-                        WHERE id = :id
-                        """
-                    ),
-                    {"id": row_id, "cover_media_url": new_url},
-                )
-                stats.updated_rows += 1
-                if commit_every > 0 and stats.updated_rows % commit_every == 0:
-                    session.commit()
-            except Exception as exc:  # noqa: BLE001
-                stats.errors += 1
-                print(f"[sources:{row_id}] update failed: {exc}")
-                continue
-
-        stats.migrated += 1
-        converted_cache[cache_key] = (new_url, src_w, src_h)
+            pending_updates.append((row.id, str(outcome.new_url)))
+            if commit_every > 0 and len(pending_updates) >= commit_every:
+                _flush_updates()
         updates_preview.append(
             {
-                "scope": "sources",
-                "id": str(row_id),
-                "slug": slug,
+                "scope": scope,
+                "id": str(row.id),
+                "slug": row.slug,
                 "from": current_url,
-                "to": new_url,
-                "source_size": f"{src_w}x{src_h}",
+                "to": str(outcome.new_url),
+                "source_size": f"{outcome.src_w}x{outcome.src_h}",
             }
         )
 
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        # Work is submitted while `rows` (possibly a server-side cursor) is still being read, so
+        # image work overlaps the DB read. Results are only consumed, and commits only issued,
+        # once the cursor is drained; by then each group holds every row sharing its URL.
+        groups: dict[tuple[str, str], list[CardRow]] = {}
+        futures = {}
+        for row in rows:
+            stats.scanned += 1
+            current_url = row.url
+            if not current_url:
+                stats.skipped_empty += 1
+                continue
+            if _is_placeholder_image(current_url):
+                stats.skipped_placeholder += 1
+                continue
+            if skip_already_target_size and _TARGET_URL_RE.search(urlsplit(current_url).path):
+                # Already points at a migrated blob (e.g. a rerun): no download/transform/upload needed.
+                stats.skipped_already_target += 1
+                continue
+            row_bucket = row.bucket
+            group = groups.get((row_bucket, current_url))
+            if group is not None:
+                group.append(row)
+                continue
+            groups[(row_bucket, current_url)] = [row]
+
+            # Bucket handles are created here (once per distinct bucket) so workers only read the cache.
+            if row_bucket not in bucket_cache:
+                bucket_cache[row_bucket] = client.bucket(row_bucket)
+            fallback_prefix, fallback_key = fallback_target(row)
+            future = pool.submit(
+                _process_row,
+                current_url=current_url,
+                row_bucket=row_bucket,
+                fallback_prefix=fallback_prefix,
+                fallback_key=fallback_key,
+                apply_changes=apply_changes,
+                allow_external_downloads=allow_external_downloads,
+                skip_already_target_size=skip_already_target_size,
+                output_format=output_format,
+                client=client,
+                bucket_cache=bucket_cache,
+                transform_pool=transform_pool,
+            )
+            futures[future] = (row_bucket, current_url)
+
+        for future in tqdm(as_completed(futures), total=len(futures), desc=scope, unit="img"):
+            row_bucket, current_url = futures[future]
+            group = groups[(row_bucket, current_url)]
+            outcome = future.result()
+            row_id = group[0].id
+            if outcome.used_external:
+                stats.external_downloads += 1
+            if outcome.reused_transform:
+                stats.reused_transforms += 1
+            if outcome.error:
+                stats.errors += len(group)
+                logger.error("[%s:%s] %s", scope, row_id, outcome.error)
+                continue
+            if outcome.unhandled:
+                stats.skipped_unhandled_url += len(group)
+                continue
+
+            if outcome.already_target:
+                stats.skipped_already_target += 1
+            else:
+                _record(group[0], current_url, outcome)
+                stats.migrated += 1
+
+            for row in group[1:]:
+                stats.reused_conversions += 1
+                if outcome.new_url != current_url:
+                    _record(row, current_url, outcome)
+
+    _flush_updates()
     return stats, updates_preview
 
 
+def _migrate_people(session, *, rows: Iterable[CardRow], **options) -> tuple[Stats, list[dict[str, str]]]:
+    def _fallback_target(row: CardRow) -> tuple[str, str]:
+        return f"{DEFAULT_MEDIA_PREFIX}/{_slugify(row.slug)}", f"people-{row.id}-{row.slug}"
+
+    return _migrate_scope(
+        session,
+        scope="people",
+        table="people_cards",
+        url_column="image_url",
+        rows=rows,
+        fallback_target=_fallback_target,
+        **options,
+    )
+
+
+def _migrate_sources(session, *, rows: Iterable[CardRow], **options) -> tuple[Stats, list[dict[str, str]]]:
+    def _fallback_target(row: CardRow) -> tuple[str, str]:
+        fallback_prefix = row.folder_prefix or f"{DEFAULT_MEDIA_PREFIX}/sources/{_slugify(row.slug)}"
+        return fallback_prefix, f"source-{row.id}-{row.slug}"
+
+    return _migrate_scope(
+        session,
+        scope="sources",
+        table="sources_cards",
+        url_column="cover_media_url",
+        rows=rows,
+        fallback_target=_fallback_target,
+        **options,
+    )
+
+
 def _print_stats(label: str, stats: Stats) -> None:
     print(f"\n[{label}]")
     for key, value in stats.as_dict().items():
@@ -549,6 +713,12 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--sources-only", action="store_true", help="Migrate only app.sources_cards.cover_media_url.")
     parser.add_argument("--limit", type=int, default=None, help="Limit rows per scope (after offset).")
     parser.add_argument("--offset", type=int, default=0, help="Offset rows per scope.")
+    parser.add_argument(
+        "--after-id",
+        type=int,
+        default=0,
+        help="Only rows with id greater than this (resume point from a previous run's last id).",
+    )
     parser.add_argument("--commit-every", type=int, default=25, help="Commit every N updated rows when --apply is enabled.")
     parser.add_argument(
         "--allow-external-downloads",
@@ -560,12 +730,34 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Reprocess images even if already 360x270.",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Worker threads for download/transform/upload (default: {DEFAULT_CONCURRENCY}).",
+    )
+    parser.add_argument(
+        "--transform-processes",
+        type=int,
+        default=DEFAULT_TRANSFORM_PROCESSES,
+        help=(
+            f"Worker processes for image transforms (default: {DEFAULT_TRANSFORM_PROCESSES}); "
+            "0 transforms on the I/O threads."
+        ),
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=sorted(OUTPUT_FORMATS),
+        default=DEFAULT_OUTPUT_FORMAT,
+        help=f"Encoding for migrated images (default: {DEFAULT_OUTPUT_FORMAT}); transparent images stay PNG.",
+    )
     parser.add_argument("--report-file", default="", help="Optional path to write JSON report.")
     return parser.parse_args()
 
 
 def main() -> int:
     args = parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
 
     env_file = str(args.env_file or "").strip()
     if env_file:
@@ -581,25 +773,44 @@ def main() -> int:
         print("Nothing selected: use default, --people-only, or --sources-only.")
         return 2
 
+    # Decode/resize dominate CPU once I/O is parallel; show whether this Pillow build has the fast paths.
+    print(f"Pillow {Image.__version__} (libjpeg-turbo: {bool(features.check('libjpeg_turbo'))})")
+
+    output_format = str(args.output_format)
+    Image.init()
+    if OUTPUT_FORMATS[output_format][0] not in Image.SAVE:
+        print(f"This Pillow build cannot encode {output_format}; pick another --output-format.")
+        return 2
+
     apply_changes = bool(args.apply)
     skip_already_target_size = not bool(args.force_reprocess_target_size)
 
-    client = storage_client()
+    concurrency = max(1, int(args.concurrency))
+    # Size the storage HTTP pool to the workers so parallel transfers don't queue for a connection.
+    client = storage_client(http_pool_size=concurrency)
     bucket_cache: dict[str, Any] = {}
 
-    with session_scope() as session:
-        people_rows_all, sources_rows_all = _load_rows(
-            session,
-            include_people=include_people,
-            include_sources=include_sources,
+    row_window = {
+        "offset": max(0, int(args.offset)),
+        "limit": args.limit,
+        "after_id": max(0, int(args.after_id)),
+    }
+
+    transform_processes = max(0, int(args.transform_processes))
+    # forkserver: by now the HTTP session, GCS client and DB pool may hold threads and locks
+    # that a plain fork would copy into the workers in whatever state they happen to be in.
+    transform_pool = (
+        ProcessPoolExecutor(
+            max_workers=transform_processes,
+            mp_context=multiprocessing.get_context("forkserver"),
+            initializer=_init_transform_worker,
         )
+        if transform_processes
+        else None
+    )
 
-        people_rows = list(_iter_limited(people_rows_all, offset=max(0, int(args.offset)), limit=args.limit))
-        sources_rows = list(_iter_limited(sources_rows_all, offset=max(0, int(args.offset)), limit=args.limit))
-
+    with session_scope() as session, transform_pool or contextlib.nullcontext():
         print("Migration mode:", "APPLY" if apply_changes else "DRY-RUN")
-        print(f"People rows selected: {len(people_rows)}")
-        print(f"Sources rows selected: {len(sources_rows)}")
 
         people_stats = Stats()
         sources_stats = Stats()
@@ -609,25 +820,31 @@ def main() -> int:
         if include_people:
             people_stats, people_updates = _migrate_people(
                 session,
-                rows=people_rows,
+                rows=_iter_rows(session, _PEOPLE_ROWS_SQL, **row_window),
                 apply_changes=apply_changes,
                 commit_every=max(0, int(args.commit_every)),
                 allow_external_downloads=bool(args.allow_external_downloads),
                 skip_already_target_size=skip_already_target_size,
+                output_format=output_format,
                 client=client,
                 bucket_cache=bucket_cache,
+                concurrency=concurrency,
+                transform_pool=transform_pool,
             )
 
         if include_sources:
             sources_stats, sources_updates = _migrate_sources(
                 session,
-                rows=sources_rows,
+                rows=_iter_rows(session, _SOURCES_ROWS_SQL, **row_window),
                 apply_changes=apply_changes,
                 commit_every=max(0, int(args.commit_every)),
                 allow_external_downloads=bool(args.allow_external_downloads),
                 skip_already_target_size=skip_already_target_size,
+                output_format=output_format,
                 client=client,
                 bucket_cache=bucket_cache,
+                concurrency=concurrency,
+                transform_pool=transform_pool,
             )
 
         # Ensure final commit after batched commits.
@@ -657,6 +874,7 @@ def main() -> int:
         report_payload = {
             "mode": "apply" if apply_changes else "dry-run",
             "target_size": {"width": TARGET_WIDTH, "height": TARGET_HEIGHT},
+            "output_format": output_format,
             "people": people_stats.as_dict(),
             "sources": sources_stats.as_dict(),
             "sample_updates": sample_updates,
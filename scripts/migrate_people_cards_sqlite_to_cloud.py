@@ -9,16 +9,24 @@ import os
 import re
 import sqlite3
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 try:
     from dotenv import load_dotenv
 except ModuleNotFoundError:  # pragma: no cover - fallback when python-dotenv is unavailable
     def load_dotenv(*_args, **_kwargs):  # type: ignore[no-redef]
         return False
+try:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing handlers still apply.
+    from orjson import loads as _json_loads
+except ModuleNotFoundError:  # pragma: no cover - orjson ships with gradio, but stay usable without it
+    _json_loads = json.loads
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -28,13 +36,27 @@ if str(PROJECT_ROOT) not in sys.path:
 
 import src.gcs_storage as gcs_storage
 from src.db import session_scope
-from src.employees import ensure_user
+from src.employees import ensure_user, ensure_users, normalize_email
 from src.gcs_storage import blob_exists, bucket_name, media_path, upload_bytes
 from src.people_proposal_diffs import normalize_proposal_scope
 
-_IMAGE_PATH_RE = re.compile(r"/images/[A-Za-z0-9._/\-]+")
+_IMAGE_PATH_RE = re.compile(r"(/images/[A-Za-z0-9._/\-]+)")
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
 _VALID_STATUS = {"pending", "accepted", "declined", "reported"}
 _DEFAULT_MEDIA_PREFIX = "the-list/migration/legacy-images"
+_DEFAULT_BATCH_SIZE = 1000
+_DEFAULT_UPLOAD_CONCURRENCY = 16
+_SOURCE_FETCH_SIZE = 1000
+_DEFAULT_COMMIT_EVERY = 500
+_PROGRESS_INTERVAL_SECONDS = 1.0
+# Read-side tuning for the source DB: 1 GiB mmap, 256 MiB page cache, in-memory temp sorts. query_only
+# guards the source file; journal/sync settings are left alone since nothing is written.
+_SQLITE_SOURCE_PRAGMAS = """
+PRAGMA mmap_size = 1073741824;
+PRAGMA cache_size = -262144;
+PRAGMA temp_store = MEMORY;
+PRAGMA query_only = ON;
+"""
 
 
 @dataclass
@@ -57,6 +79,13 @@ class MigrationStats:
         self.warnings.append(message)
 
 
+def _clean(value: Any) -> str:
+    """`str(value or "").strip()` without the str() round-trip for values that already are strings."""
+    if isinstance(value, str):
+        return value.strip()
+    return str(value).strip() if value else ""
+
+
 def _has_sqlite_table(conn: sqlite3.Connection, name: str) -> bool:
     row = conn.execute(
         "SELECT 1 FROM sqlite_master WHERE type='table' AND name = ? LIMIT 1",
@@ -65,43 +94,88 @@ def _has_sqlite_table(conn: sqlite3.Connection, name: str) -> bool:
     return row is not None
 
 
-def _rows(conn: sqlite3.Connection, query: str) -> list[dict[str, Any]]:
-    return [dict(row) for row in conn.execute(query).fetchall()]
+class _SourceRow(sqlite3.Row):
+    """`sqlite3.Row` with the `dict.get` the import loops use, so rows need no dict copy."""
+
+    __slots__ = ()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except IndexError:
+            return default
+
+
+class _SourceRows:
+    """
+    One legacy SQLite table, streamed with `fetchmany` each time it is iterated instead of being
+    loaded whole. Iterating again re-runs the (local) query; `len()` is a COUNT(*) taken up front.
+    A missing table behaves as empty.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, table: str, *, order_by: str = "") -> None:
+        self._conn = conn
+        self._exists = _has_sqlite_table(conn, table)
+        self._query = f"SELECT * FROM {table}" + (f" ORDER BY {order_by}" if order_by else "")
+        self._count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] if self._exists else 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[_SourceRow]:
+        if not self._exists:
+            return
+        cursor = self._conn.cursor()
+        cursor.row_factory = _SourceRow
+        cursor.execute(self._query)
+        while chunk := cursor.fetchmany(_SOURCE_FETCH_SIZE):
+            yield from chunk
 
 
 def _parse_json_list(raw_value: Any) -> list[str]:
     if raw_value is None:
         return []
     if isinstance(raw_value, list):
-        source = raw_value
-    else:
-        try:
-            source = json.loads(str(raw_value))
-        except json.JSONDecodeError:
-            return []
+        return list(_dedupe_tags(raw_value))
+    return list(_parse_json_text(str(raw_value)))
+
+
+@lru_cache(8192)
+def _parse_json_text(raw_value: str) -> tuple[str, ...]:
+    # Cached on the raw JSON text: the same tag lists recur across many cards.
+    try:
+        source = _json_loads(raw_value)
+    except json.JSONDecodeError:
+        return ()
     if not isinstance(source, list):
-        return []
+        return ()
+    return _dedupe_tags(source)
+
+
+def _dedupe_tags(source: list[Any]) -> tuple[str, ...]:
     result: list[str] = []
     seen: set[str] = set()
     for item in source:
-        tag = str(item or "").strip().lower()
+        tag = _clean(item).lower()
         if not tag or tag in seen:
             continue
         seen.add(tag)
         result.append(tag)
-    return result
+    return tuple(result)
 
 
 def _parse_timestamp(raw_value: Any) -> datetime | None:
-    value = str(raw_value or "").strip()
+    value = _clean(raw_value)
     if not value:
         return None
     try:
-        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        # Python 3.11+ `fromisoformat` accepts the trailing "Z" itself.
+        return datetime.fromisoformat(value)
     except ValueError:
         return None
 
 
+@lru_cache(64)
 def _normalize_status(raw_value: Any) -> str:
     value = str(raw_value or "").strip().lower()
     if value == "rejected":
@@ -111,104 +185,311 @@ def _normalize_status(raw_value: Any) -> str:
     return "pending"
 
 
+@lru_cache(8192)
 def _slugify(value: str) -> str:
-    normalized = re.sub(r"[^a-z0-9]+", "-", (value or "").strip().lower())
+    normalized = _SLUG_RE.sub("-", (value or "").strip().lower())
     return normalized.strip("-") or "value"
 
 
-def _upsert_person(session, name: str) -> int:
-    person_name = str(name or "").strip() or "Unknown"
-    existing_id = session.execute(
+# SQL twin of `_slugify` for title/tag codes, so the upserts derive `code` from `label` server-side.
+_SQL_SLUGIFY_LABEL = "COALESCE(NULLIF(BTRIM(REGEXP_REPLACE(LOWER(v.label), '[^a-z0-9]+', '-', 'g'), '-'), ''), 'value')"
+
+
+# Proposal/event upserts, one statement per batch of source rows via parallel UNNEST arrays.
+_SQL_UPSERT_PROPOSALS = text(
+    """
+    INSERT INTO app.people_change_proposals (
+        id,
+        person_slug,
+        person_id,
+        proposer_user_id,
+        proposal_scope,
+        base_payload,
+        proposed_payload,
+        note,
+        status,
+        created_at,
+        reviewed_at,
+        reviewer_user_id,
+        review_note,
+        report_triggered
+    )
+    SELECT
+        v.id,
+        v.person_slug,
+        v.person_id,
+        v.proposer_user_id,
+        v.proposal_scope,
+        v.base_payload,
+        v.proposed_payload,
+        v.note,
+        v.status,
+        COALESCE(v.created_at, now()),
+        v.reviewed_at,
+        v.reviewer_user_id,
+        v.review_note,
+        v.report_triggered
+    FROM UNNEST(
+        CAST(:ids AS bigint[]),
+        CAST(:person_slugs AS text[]),
+        CAST(:person_ids AS bigint[]),
+        CAST(:proposer_user_ids AS bigint[]),
+        CAST(:proposal_scopes AS text[]),
+        CAST(:base_payloads AS text[]),
+        CAST(:proposed_payloads AS text[]),
+        CAST(:notes AS text[]),
+        CAST(:statuses AS text[]),
+        CAST(:created_ats AS timestamptz[]),
+        CAST(:reviewed_ats AS timestamptz[]),
+        CAST(:reviewer_user_ids AS bigint[]),
+        CAST(:review_notes AS text[]),
+        CAST(:report_triggereds AS integer[])
+    ) AS v(
+        id,
+        person_slug,
+        person_id,
+        proposer_user_id,
+        proposal_scope,
+        base_payload,
+        proposed_payload,
+        note,
+        status,
+        created_at,
+        reviewed_at,
+        reviewer_user_id,
+        review_note,
+        report_triggered
+    )
+    ON CONFLICT (id) DO UPDATE
+    SET person_slug = EXCLUDED.person_slug,
+        person_id = EXCLUDED.person_id,
+        proposer_user_id = EXCLUDED.proposer_user_id,
+        proposal_scope = EXCLUDED.proposal_scope,
+        base_payload = EXCLUDED.base_payload,
+        proposed_payload = EXCLUDED.proposed_payload,
+        note = EXCLUDED.note,
+        status = EXCLUDED.status,
+        created_at = EXCLUDED.created_at,
+        reviewed_at = EXCLUDED.reviewed_at,
+        reviewer_user_id = EXCLUDED.reviewer_user_id,
+        review_note = EXCLUDED.review_note,
+        report_triggered = EXCLUDED.report_triggered
+    """
+)
+
+_SQL_UPSERT_EVENTS = text(
+    """
+    INSERT INTO app.people_change_events (
+        id,
+        proposal_id,
+        event_type,
+        actor_user_id,
+        notes,
+        payload_json,
+        created_at
+    )
+    SELECT
+        v.id,
+        v.proposal_id,
+        v.event_type,
+        v.actor_user_id,
+        v.notes,
+        v.payload_json,
+        COALESCE(v.created_at, now())
+    FROM UNNEST(
+        CAST(:ids AS bigint[]),
+        CAST(:proposal_ids AS bigint[]),
+        CAST(:event_types AS text[]),
+        CAST(:actor_user_ids AS bigint[]),
+        CAST(:notes AS text[]),
+        CAST(:payload_jsons AS text[]),
+        CAST(:created_ats AS timestamptz[])
+    ) AS v(id, proposal_id, event_type, actor_user_id, notes, payload_json, created_at)
+    ON CONFLICT (id) DO UPDATE
+    SET proposal_id = EXCLUDED.proposal_id,
+        event_type = EXCLUDED.event_type,
+        actor_user_id = EXCLUDED.actor_user_id,
+        notes = EXCLUDED.notes,
+        payload_json = EXCLUDED.payload_json,
+        created_at = EXCLUDED.created_at
+    """
+)
+
+
+def _execute_unnest_batch(session, statement, rows: list[tuple[Any, ...]], bind_names: tuple[str, ...]) -> None:
+    """Run an UNNEST upsert whose array parameters `bind_names` are the columns of `rows`, in order."""
+    if not rows:
+        return
+    session.execute(statement, dict(zip(bind_names, (list(column) for column in zip(*rows)))))
+
+
+def _load_people_ids(session) -> dict[str, int]:
+    """Lowercased name -> id for every existing person (lowest id wins, as the old per-row lookup did)."""
+    people_by_name: dict[str, int] = {}
+    # Lowercased here rather than in SQL so keys match the lookups done in Python.
+    for person_id, name in session.execute(text("SELECT id, name FROM app.people ORDER BY id ASC")):
+        people_by_name.setdefault(str(name).lower(), int(person_id))
+    return people_by_name
+
+
+def _load_title_ids(session) -> dict[str, int]:
+    return {label: int(title_id) for title_id, label in session.execute(text("SELECT id, label FROM app.people_titles"))}
+
+
+def _insert_missing_people(session, names: list[str], people_by_name: dict[str, int]) -> None:
+    missing: dict[str, str] = {}
+    for name in names:
+        name_key = name.lower()
+        if name_key not in people_by_name:
+            missing.setdefault(name_key, name)
+    if not missing:
+        return
+    inserted = session.execute(
         text(
             """
-            SELECT id
-            FROM app.people
-            WHERE lower(name) = lower(:name)
-            ORDER BY id ASC
-            LIMIT 1
+            INSERT INTO app.people (name)
+            SELECT UNNEST(CAST(:names AS text[]))
+            RETURNING id, name
             """
         ),
-        {"name": person_name},
-    ).scalar_one_or_none()
-    if existing_id is not None:
-        return int(existing_id)
-    return int(
-        session.execute(
-            text(
-                """
-                INSERT INTO app.people (name)
-                VALUES (:name)
-                RETURNING id
-                """
-            ),
-            {"name": person_name},
-        ).scalar_one()
+        {"names": list(missing.values())},
     )
+    for person_id, name in inserted:
+        people_by_name[str(name).lower()] = int(person_id)
 
 
-def _upsert_title(session, title: str) -> int:
-    label = str(title or "").strip() or "Unassigned"
-    return int(
-        session.execute(
-            text(
-                """
-                INSERT INTO app.people_titles (code, label)
-                VALUES (:code, :label)
+def _insert_missing_titles(session, labels: list[str], titles_by_label: dict[str, int]) -> None:
+    missing = list(dict.fromkeys(label for label in labels if label not in titles_by_label))
+    if not missing:
+        return
+    inserted = session.execute(
+        text(
+            f"""
+            INSERT INTO app.people_titles (code, label)
+            SELECT {_SQL_SLUGIFY_LABEL}, v.label
+            FROM UNNEST(CAST(:labels AS text[])) AS v(label)
+            ON CONFLICT (label) DO UPDATE
+            SET code = EXCLUDED.code,
+                updated_at = now()
+            RETURNING id, label
+            """
+        ),
+        {"labels": missing},
+    )
+    for title_id, label in inserted:
+        titles_by_label[label] = int(title_id)
+
+
+def _sync_people_tags(session, tags_by_person: dict[int, tuple[str, ...]]) -> None:
+    """Replace the tag links of every person in the batch: one DELETE plus one upsert-and-link."""
+    if not tags_by_person:
+        return
+    session.execute(
+        text("DELETE FROM app.people_person_tags WHERE person_id = ANY(CAST(:person_ids AS bigint[]))"),
+        {"person_ids": list(tags_by_person)},
+    )
+    pair_person_ids = [person_id for person_id, tags in tags_by_person.items() for _ in tags]
+    pair_labels = [tag for tags in tags_by_person.values() for tag in tags]
+    if not pair_labels:
+        return
+    labels = list(dict.fromkeys(pair_labels))
+    # RETURNING covers both newly inserted and conflict-updated tags, so every label gets its id.
+    session.execute(
+        text(
+            f"""
+            WITH upserted AS (
+                INSERT INTO app.people_tags (code, label)
+                SELECT {_SQL_SLUGIFY_LABEL}, v.label
+                FROM UNNEST(CAST(:labels AS text[])) AS v(label)
                 ON CONFLICT (label) DO UPDATE
                 SET code = EXCLUDED.code,
                     updated_at = now()
-                RETURNING id
-                """
-            ),
-            {"code": _slugify(label), "label": label},
-        ).scalar_one()
+                RETURNING id, label
+            )
+            INSERT INTO app.people_person_tags (person_id, tag_id)
+            SELECT p.person_id, upserted.id
+            FROM UNNEST(CAST(:pair_person_ids AS bigint[]), CAST(:pair_labels AS text[])) AS p(person_id, label)
+            JOIN upserted ON upserted.label = p.label
+            ON CONFLICT (person_id, tag_id) DO NOTHING
+            """
+        ),
+        {
+            "labels": labels,
+            "pair_person_ids": pair_person_ids,
+            "pair_labels": pair_labels,
+        },
     )
 
 
-def _sync_person_tags(session, *, person_id: int, tags: list[str]) -> int:
-    normalized_person_id = int(person_id or 0)
-    if normalized_person_id <= 0:
-        return 0
-    deduped_tags: list[str] = []
-    seen: set[str] = set()
-    for raw_tag in tags:
-        tag = str(raw_tag or "").strip().lower()
-        if not tag or tag in seen:
-            continue
-        seen.add(tag)
-        deduped_tags.append(tag)
-
+def _upsert_card_batch(
+    session,
+    *,
+    bucket: str,
+    cards_by_slug: dict[str, dict[str, Any]],
+    people_by_name: dict[str, int],
+    titles_by_label: dict[str, int],
+) -> dict[str, int]:
+    """
+    Write a batch of cards with a fixed number of statements: new people and titles are
+    inserted in bulk (known ones come from the preloaded maps), then cards, articles and
+    tag links are upserted from UNNEST'd arrays. Keyed by slug so a batch never hits the
+    same conflict row twice (Postgres rejects that within one INSERT ... ON CONFLICT).
+    Returns slug -> person_id for the batch.
+    """
+    if not cards_by_slug:
+        return {}
+    cards = list(cards_by_slug.values())
+    _insert_missing_people(session, [card["name"] for card in cards], people_by_name)
+    _insert_missing_titles(session, [card["title"] for card in cards], titles_by_label)
+    person_id_by_slug = {slug: people_by_name[card["name"].lower()] for slug, card in cards_by_slug.items()}
+
+    slugs = list(cards_by_slug)
     session.execute(
-        text("DELETE FROM app.people_person_tags WHERE person_id = :person_id"),
-        {"person_id": normalized_person_id},
+        text(
+            """
+            INSERT INTO app.people_cards (slug, person_id, bucket, title_id, image_url)
+            SELECT v.slug, v.person_id, :bucket, v.title_id, v.image_url
+            FROM UNNEST(
+                CAST(:slugs AS text[]),
+                CAST(:person_ids AS bigint[]),
+                CAST(:title_ids AS bigint[]),
+                CAST(:image_urls AS text[])
+            ) AS v(slug, person_id, title_id, image_url)
+            ON CONFLICT (slug) DO UPDATE
+            SET person_id = EXCLUDED.person_id,
+                bucket = EXCLUDED.bucket,
+                title_id = EXCLUDED.title_id,
+                image_url = EXCLUDED.image_url,
+                updated_at = now()
+            """
+        ),
+        {
+            "bucket": bucket,
+            "slugs": slugs,
+            "person_ids": list(person_id_by_slug.values()),
+            "title_ids": [titles_by_label[card["title"]] for card in cards],
+            "image_urls": [card["image_url"] for card in cards],
+        },
     )
-    for tag in deduped_tags:
-        tag_id = int(
-            session.execute(
-                text(
-                    """
-                    INSERT INTO app.people_tags (code, label)
-                    VALUES (:code, :label)
-                    ON CONFLICT (label) DO UPDATE
-                    SET code = EXCLUDED.code,
-                        updated_at = now()
-                    RETURNING id
-                    """
-                ),
-                {"code": _slugify(tag), "label": tag},
-            ).scalar_one()
-        )
-        session.execute(
-            text(
-                """
-                INSERT INTO app.people_person_tags (person_id, tag_id)
-                VALUES (:person_id, :tag_id)
-                ON CONFLICT (person_id, tag_id) DO NOTHING
-                """
-            ),
-            {"person_id": normalized_person_id, "tag_id": tag_id},
-        )
-    return len(deduped_tags)
+    session.execute(
+        text(
+            """
+            INSERT INTO app.people_articles (person_slug, markdown)
+            SELECT v.person_slug, v.markdown
+            FROM UNNEST(CAST(:slugs AS text[]), CAST(:markdowns AS text[])) AS v(person_slug, markdown)
+            ON CONFLICT (person_slug) DO UPDATE
+            SET markdown = EXCLUDED.markdown,
+                updated_at = now()
+            """
+        ),
+        {"slugs": slugs, "markdowns": [card["markdown"] for card in cards]},
+    )
+    # A person on several cards keeps the tags of the last one, as with per-row syncing.
+    _sync_people_tags(
+        session,
+        {person_id_by_slug[slug]: card["tags"] for slug, card in cards_by_slug.items()},
+    )
+    return person_id_by_slug
 
 
 def _ensure_target_schema(session) -> None:
@@ -233,6 +514,7 @@ def _ensure_target_schema(session) -> None:
               email            TEXT PRIMARY KEY REFERENCES app."user"(email) ON UPDATE CASCADE ON DELETE CASCADE,
               base_user         BOOLEAN NOT NULL DEFAULT FALSE,
               reviewer          BOOLEAN NOT NULL DEFAULT FALSE,
+              editor            BOOLEAN NOT NULL DEFAULT FALSE,
               admin             BOOLEAN NOT NULL DEFAULT FALSE,
               creator           BOOLEAN NOT NULL DEFAULT FALSE
             )
@@ -358,8 +640,28 @@ def _ensure_target_schema(session) -> None:
     )
 
 
-def _upsert_diff_payload_qualified(
-    session,
+def _merge_card_payload_with_image(raw_payload: str, image_url: str) -> str:
+    parsed: dict[str, Any] = {}
+    try:
+        parsed_candidate = _json_loads(str(raw_payload or "").strip())
+        if isinstance(parsed_candidate, dict):
+            parsed = dict(parsed_candidate)
+    except json.JSONDecodeError:
+        parsed = {}
+    merged_payload = {
+        "name": str(parsed.get("name") or "").strip(),
+        "title": str(parsed.get("title") or parsed.get("bucket") or "").strip(),
+        "tags": [
+            str(tag).strip().lower()
+            for tag in (parsed.get("tags") if isinstance(parsed.get("tags"), list) else [])
+            if str(tag).strip()
+        ],
+        "image_url": str(image_url or "").strip() or str(parsed.get("image_url") or "").strip(),
+    }
+    return json.dumps(merged_payload, ensure_ascii=True, sort_keys=True, separators=(",", ":"))
+
+
+def _qualified_diff_payloads(
     *,
     proposal_id: int,
     person_id: int,
@@ -368,57 +670,23 @@ def _upsert_diff_payload_qualified(
     proposed_payload: str,
     base_image_url: str,
     proposed_image_url: str,
-) -> None:
+) -> tuple[str, str]:
+    """
+    (base_payload, proposed_payload) as stored for a proposal: card proposals carry their
+    card JSON merged with the resolved image URLs, article proposals keep their markdown.
+    """
     normalized_scope = normalize_proposal_scope(scope)
     normalized_person_id = int(person_id or 0)
     if normalized_person_id <= 0:
         raise ValueError(f"Could not resolve person_id for proposal_id={int(proposal_id)}")
 
-    def _merge_card_payload_with_image(raw_payload: str, image_url: str) -> str:
-        parsed: dict[str, Any] = {}
-        try:
-            parsed_candidate = json.loads(str(raw_payload or "").strip())
-            if isinstance(parsed_candidate, dict):
-                parsed = dict(parsed_candidate)
-        except json.JSONDecodeError:
-            parsed = {}
-        merged_payload = {
-            "name": str(parsed.get("name") or "").strip(),
-            "title": str(parsed.get("title") or parsed.get("bucket") or "").strip(),
-            "tags": [
-                str(tag).strip().lower()
-                for tag in (parsed.get("tags") if isinstance(parsed.get("tags"), list) else [])
-                if str(tag).strip()
-            ],
-            "image_url": str(image_url or "").strip() or str(parsed.get("image_url") or "").strip(),
-        }
-        return json.dumps(merged_payload, ensure_ascii=True, sort_keys=True, separators=(",", ":"))
-
     base_payload_value = str(base_payload or "")
     proposed_payload_value = str(proposed_payload or "")
     if normalized_scope == "card":
         base_payload_value = _merge_card_payload_with_image(base_payload_value, str(base_image_url or ""))
         proposed_payload_value = _merge_card_payload_with_image(proposed_payload_value, str(proposed_image_url or ""))
 
-    session.execute(
-        text(
-            """
-            UPDATE app.people_change_proposals
-            SET person_id = :person_id,
-                proposal_scope = :proposal_scope,
-                base_payload = :base_payload,
-                proposed_payload = :proposed_payload
-            WHERE id = :proposal_id
-            """
-        ),
-        {
-            "proposal_id": int(proposal_id),
-            "person_id": normalized_person_id,
-            "proposal_scope": normalized_scope,
-            "base_payload": base_payload_value,
-            "proposed_payload": proposed_payload_value,
-        },
-    )
+    return base_payload_value, proposed_payload_value
 
 
 def _resolve_local_image_path(raw_url: str, project_root: Path) -> Path | None:
@@ -447,18 +715,28 @@ def _rewrite_image_paths_in_text(
     if not text_value or "/images/" not in text_value:
         return text_value
 
-    def _replace(match: re.Match[str]) -> str:
-        return transform_image_url(match.group(0))
-
-    return _IMAGE_PATH_RE.sub(_replace, text_value)
+    # Split once and map each distinct path once: `split` with a capturing group puts the
+    # matched paths at the odd indexes, so the rewrite is a plain join with no per-match callback.
+    parts = _IMAGE_PATH_RE.split(text_value)
+    if len(parts) == 1:
+        return text_value
+    replacements = {path: transform_image_url(path) for path in set(parts[1::2])}
+    if all(path == mapped for path, mapped in replacements.items()):
+        return text_value
+    parts[1::2] = [replacements[path] for path in parts[1::2]]
+    return "".join(parts)
 
 
 def _rewrite_payload_json(raw_payload: str, *, transform_image_url) -> str:
     payload_text = str(raw_payload or "").strip()
     if not payload_text:
         return "{}"
+    # Nothing to rewrite without an /images/ path or an *image_url key (which may hold another
+    # local path form); skip the parse/serialize round-trip and keep the stored text as-is.
+    if "/images/" not in payload_text and "image_url" not in payload_text:
+        return payload_text
     try:
-        payload = json.loads(payload_text)
+        payload = _json_loads(payload_text)
     except json.JSONDecodeError:
         return _rewrite_image_paths_in_text(payload_text, transform_image_url=transform_image_url)
 
@@ -481,32 +759,6 @@ def _rewrite_payload_json(raw_payload: str, *, transform_image_url) -> str:
     return json.dumps(rewritten_payload, ensure_ascii=True)
 
 
-def _collect_unique_users(
-    local_privileges: list[dict[str, Any]],
-    proposals: list[dict[str, Any]],
-    events: list[dict[str, Any]],
-) -> list[tuple[str, str]]:
-    users: list[tuple[str, str]] = []
-    seen: set[str] = set()
-
-    def _add(email: Any, name_hint: Any) -> None:
-        email_value = str(email or "").strip().lower()
-        if not email_value or email_value in seen:
-            return
-        seen.add(email_value)
-        display = str(name_hint or "").strip() or email_value.split("@", 1)[0]
-        users.append((email_value, display))
-
-    for row in local_privileges:
-        _add(row.get("email"), None)
-    for row in proposals:
-        _add(row.get("proposer_email"), row.get("proposer_name"))
-        _add(row.get("reviewer_email"), None)
-    for row in events:
-        _add(row.get("actor_email"), row.get("actor_name"))
-    return users
-
-
 def run_migration(args: argparse.Namespace) -> MigrationStats:
     project_root = Path(__file__).resolve().parents[1]
     sqlite_path = Path(args.sqlite_path).expanduser().resolve()
@@ -517,6 +769,10 @@ def run_migration(args: argparse.Namespace) -> MigrationStats:
     if env_path.is_file():
         load_dotenv(env_path, override=True)
     _ensure_tls_cert_bundle()
+    # No page requests here to attribute SQL time to; keep the timing listeners off the engine.
+    os.environ.setdefault("DB_QUERY_TIMING", "0")
+    # One long-lived session: a liveness ping per checkout is just an extra round-trip.
+    os.environ.setdefault("DB_POOL_PRE_PING", "0")
 
     stats = MigrationStats()
 
@@ -529,29 +785,36 @@ def run_migration(args: argparse.Namespace) -> MigrationStats:
     gcs_storage.DEFAULT_BUCKET = resolved_bucket
 
     print(f"[migration] sqlite source: {sqlite_path}", flush=True)
-    conn = sqlite3.connect(str(sqlite_path))
+    conn = sqlite3.connect(str(sqlite_path), isolation_level=None)
     conn.row_factory = sqlite3.Row
+    conn.executescript(_SQLITE_SOURCE_PRAGMAS)
     try:
-        cards = _rows(conn, "SELECT * FROM people_cards")
-        proposals = (
-            _rows(conn, "SELECT * FROM people_change_proposals ORDER BY id")
-            if _has_sqlite_table(conn, "people_change_proposals")
-            else []
-        )
-        events = (
-            _rows(conn, "SELECT * FROM people_change_events ORDER BY id")
-            if _has_sqlite_table(conn, "people_change_events")
-            else []
-        )
-        local_privileges = (
-            _rows(conn, "SELECT * FROM local_user_privileges")
-            if _has_sqlite_table(conn, "local_user_privileges")
-            else []
+        return _import_sqlite_source(
+            args,
+            conn,
+            stats=stats,
+            project_root=project_root,
+            resolved_bucket=resolved_bucket,
         )
     finally:
         conn.close()
+
+
+def _import_sqlite_source(
+    args: argparse.Namespace,
+    conn: sqlite3.Connection,
+    *,
+    stats: MigrationStats,
+    project_root: Path,
+    resolved_bucket: str,
+) -> MigrationStats:
+    # Source tables are streamed from `conn` on every pass rather than held in memory.
+    cards = _SourceRows(conn, "people_cards")
+    proposals = _SourceRows(conn, "people_change_proposals", order_by="id")
+    events = _SourceRows(conn, "people_change_events", order_by="id")
+    local_privileges = _SourceRows(conn, "local_user_privileges")
     print(
-        f"[migration] loaded sqlite rows: cards={len(cards)} proposals={len(proposals)} events={len(events)} local_privileges={len(local_privileges)}",
+        f"[migration] sqlite source rows: cards={len(cards)} proposals={len(proposals)} events={len(events)} local_privileges={len(local_privileges)}",
         flush=True,
     )
 
@@ -559,48 +822,141 @@ def run_migration(args: argparse.Namespace) -> MigrationStats:
     media_prefix = (args.media_prefix or _DEFAULT_MEDIA_PREFIX).strip("/ ")
     image_url_cache: dict[str, str] = {}
 
+    # Different URL strings can name the same file; key the digest/probe/upload by the file itself.
+    mapped_by_file: dict[tuple[str, int, int], str] = {}
+
+    def _is_passthrough_url(value: str) -> bool:
+        return not value or value.startswith(("/media/", "http://", "https://"))
+
+    def _file_key(local_path: Path) -> tuple[str, int, int]:
+        file_stat = local_path.stat()
+        return str(local_path.resolve()), file_stat.st_mtime_ns, file_stat.st_size
+
+    def _materialize_file(local_path: Path) -> tuple[str, bool]:
+        """
+        Hash and (unless skipped) upload one local image. Safe to run on worker threads:
+        it only returns (mapped_url, uploaded).
+        """
+        # Hash in chunks; the bytes are only read into memory when the blob actually needs uploading.
+        with local_path.open("rb") as handle:
+            digest = hashlib.file_digest(handle, "sha1").hexdigest()[:16]
+        filename = f"{digest}-{local_path.name}"
+        blob_name = f"{media_prefix}/{filename}"
+
+        uploaded = False
+        if not args.skip_bucket_upload and not args.dry_run and not blob_exists(blob_name):
+            content_type = mimetypes.guess_type(str(local_path))[0] or "application/octet-stream"
+            upload_bytes(local_path.read_bytes(), blob_name, content_type=content_type, cache_seconds=3600)
+            uploaded = True
+        return media_path(blob_name), uploaded
+
+    def _record_image(original: str, mapped: str, uploaded: bool | None) -> str:
+        if uploaded is None:
+            stats.warn(f"Could not resolve image path for `{original}`; keeping original URL.")
+        elif uploaded:
+            stats.images_uploaded += 1
+        else:
+            stats.images_reused += 1
+        image_url_cache[original] = mapped
+        return mapped
+
     def transform_image_url(raw_url: Any) -> str:
-        original = str(raw_url or "").strip()
+        original = _clean(raw_url)
         if not original:
             return ""
         if original in image_url_cache:
             return image_url_cache[original]
-        if original.startswith("/media/"):
-            image_url_cache[original] = original
-            return original
-        if original.startswith("http://") or original.startswith("https://"):
+        if _is_passthrough_url(original):
             image_url_cache[original] = original
             return original
-
         local_path = _resolve_local_image_path(original, project_root=project_root)
         if local_path is None:
-            stats.warn(f"Could not resolve image path for `{original}`; keeping original URL.")
-            image_url_cache[original] = original
-            return original
-
-        payload = local_path.read_bytes()
-        digest = hashlib.sha1(payload).hexdigest()[:16]
-        filename = f"{digest}-{local_path.name}"
-        blob_name = f"{media_prefix}/{filename}"
-        content_type = mimetypes.guess_type(str(local_path))[0] or "application/octet-stream"
+            return _record_image(original, original, None)
+        file_key = _file_key(local_path)
+        mapped = mapped_by_file.get(file_key)
+        if mapped is not None:
+            return _record_image(original, mapped, False)
+        mapped, uploaded = _materialize_file(local_path)
+        mapped_by_file[file_key] = mapped
+        return _record_image(original, mapped, uploaded)
+
+    # Pre-pass: hash/probe/upload every local image the rows reference concurrently, so the
+    # SQL loops below mostly hit `image_url_cache`. Anything missed here (e.g. odd payload
+    # keys) still goes through `transform_image_url` inline.
+    image_candidates: dict[str, None] = {}
+
+    def _collect_image_urls(*values: Any, scan_text: tuple[Any, ...] = ()) -> None:
+        for value in values:
+            image_candidates.setdefault(_clean(value))
+        for value in scan_text:
+            if value and "/images/" in str(value):
+                for match in _IMAGE_PATH_RE.findall(str(value)):
+                    image_candidates.setdefault(match)
+
+    # The same pass gathers every email the import will reference, so proposals/events are not
+    # walked again just to ensure users. A real name hint (the last one seen, as sequential
+    # `ensure_user` calls would leave it) replaces the placeholder; emails that never carry one
+    # get the email-prefix name from `ensure_users`.
+    unique_users: dict[str, str | None] = {}
+
+    def _collect_user(email: Any, name_hint: Any) -> None:
+        email_value = _clean(email).lower()
+        if not email_value:
+            return
+        name_value = _clean(name_hint)
+        if name_value or email_value not in unique_users:
+            unique_users[email_value] = name_value or None
 
-        if args.skip_bucket_upload:
-            stats.images_reused += 1
-        elif args.dry_run:
-            stats.images_reused += 1
-        else:
-            if blob_exists(blob_name):
-                stats.images_reused += 1
-            else:
-                upload_bytes(payload, blob_name, content_type=content_type, cache_seconds=3600)
-                stats.images_uploaded += 1
+    for row in local_privileges:
+        _collect_user(row.get("email"), None)
+    for row in cards:
+        _collect_image_urls(row.get("image_url"), scan_text=(row.get("markdown"),))
+    for row in proposals:
+        _collect_image_urls(
+            row.get("base_image_url"),
+            row.get("proposed_image_url"),
+            scan_text=(row.get("base_markdown"), row.get("proposed_markdown")),
+        )
+        _collect_user(row.get("proposer_email"), row.get("proposer_name"))
+        _collect_user(row.get("reviewer_email"), None)
+    for row in events:
+        _collect_image_urls(scan_text=(row.get("payload_json"),))
+        _collect_user(row.get("actor_email"), row.get("actor_name"))
 
-        mapped = media_path(blob_name)
-        image_url_cache[original] = mapped
-        return mapped
+    pending_files: dict[tuple[str, int, int], tuple[Path, list[str]]] = {}
+    for original in image_candidates:
+        if _is_passthrough_url(original):
+            continue
+        local_path = _resolve_local_image_path(original, project_root=project_root)
+        if local_path is None:
+            _record_image(original, original, None)
+            continue
+        pending_files.setdefault(_file_key(local_path), (local_path, []))[1].append(original)
+    if pending_files:
+        upload_concurrency = max(1, int(args.upload_concurrency))
+        print(
+            f"[migration] materializing {len(pending_files)} images with {upload_concurrency} workers...",
+            flush=True,
+        )
+        with ThreadPoolExecutor(max_workers=upload_concurrency) as pool:
+            results = pool.map(_materialize_file, [local_path for local_path, _ in pending_files.values()])
+            for (file_key, (_local_path, originals)), (mapped, uploaded) in zip(pending_files.items(), results):
+                mapped_by_file[file_key] = mapped
+                _record_image(originals[0], mapped, uploaded)
+                for original in originals[1:]:
+                    _record_image(original, mapped, False)
 
     user_id_by_email: dict[str, int] = {}
 
+    def _user_id(session, email: str, display_name: str) -> int:
+        # Users are ensured once up front; only emails missed by that sweep reach `ensure_user` again.
+        cached = user_id_by_email.get(normalize_email(email))
+        if cached is not None:
+            return cached
+        user_id, resolved_email, _ = ensure_user(session, user_identifier=email, display_name=display_name)
+        user_id_by_email[resolved_email.lower()] = int(user_id)
+        return int(user_id)
+
     print("[migration] connecting to Cloud SQL and ensuring target schema...", flush=True)
     with session_scope() as session:
         _ensure_target_schema(session)
@@ -608,43 +964,57 @@ def run_migration(args: argparse.Namespace) -> MigrationStats:
 
         if args.replace_existing:
             print("[migration] replacing existing target data...", flush=True)
-            session.execute(text("DELETE FROM app.people_change_events"))
-            session.execute(text("DELETE FROM app.people_change_proposals"))
-            session.execute(text("DELETE FROM app.people_person_tags"))
-            session.execute(text("DELETE FROM app.people_articles"))
-            session.execute(text("DELETE FROM app.people_cards"))
-            session.execute(text("DELETE FROM app.people_tags"))
-            session.execute(text("DELETE FROM app.people_titles"))
-            session.execute(text("DELETE FROM app.people"))
+            # One TRUNCATE instead of row-by-row DELETEs. No CASCADE: every table referencing these
+            # is in the list, so a foreign key from anywhere else fails loudly instead of being emptied.
+            session.execute(
+                text(
+                    """
+                    TRUNCATE
+                        app.people_change_events,
+                        app.people_change_proposals,
+                        app.people_person_tags,
+                        app.people_articles,
+                        app.people_cards,
+                        app.people_tags,
+                        app.people_titles,
+                        app.people
+                    RESTART IDENTITY
+                    """
+                )
+            )
             print("[migration] existing target data cleared.", flush=True)
 
-        for email, display_name in _collect_unique_users(local_privileges, proposals, events):
-            user_id, resolved_email, _ = ensure_user(
-                session,
-                user_identifier=email,
-                display_name=display_name,
-            )
-            user_id_by_email[resolved_email.lower()] = int(user_id)
-            stats.users_ensured += 1
+        for resolved_email, user_id in ensure_users(session, unique_users.items()).items():
+            user_id_by_email[resolved_email.lower()] = user_id
+        stats.users_ensured += len(unique_users)
         print(f"[migration] ensured users: {stats.users_ensured}", flush=True)
 
+        # email -> (any enabled, any programmer, last enabled); repeated emails OR their flags like the per-row upsert
+        # did, while the last row's enabled flag decides is_active.
+        privileges_by_email: dict[str, tuple[bool, bool, bool]] = {}
         for row in local_privileges:
-            email = str(row.get("email") or "").strip().lower()
+            email = _clean(row.get("email")).lower()
             if not email:
                 continue
-            user_id, resolved_email, _ = ensure_user(
-                session,
-                user_identifier=email,
-                display_name=email.split("@", 1)[0],
-            )
-            user_id_by_email[resolved_email.lower()] = int(user_id)
+            _user_id(session, email, email.split("@", 1)[0])
+            resolved_email = normalize_email(email)
             enabled = bool(int(row.get("user_enabled") or 0))
             programmer = bool(int(row.get("programmer") or 0))
+            any_enabled, any_programmer, _ = privileges_by_email.get(resolved_email, (False, False, False))
+            privileges_by_email[resolved_email] = (any_enabled or enabled, any_programmer or programmer, enabled)
+            stats.privileges_synced += 1
+        if privileges_by_email:
+            emails = list(privileges_by_email)
             session.execute(
                 text(
                     """
                     INSERT INTO app.user_privileges (email, base_user, reviewer, admin, creator)
-                    VALUES (:email, :base_user, :reviewer, :admin, :creator)
+                    SELECT v.email, v.base_user, v.programmer, v.programmer, v.programmer
+                    FROM UNNEST(
+                        CAST(:emails AS text[]),
+                        CAST(:base_users AS boolean[]),
+                        CAST(:programmers AS boolean[])
+                    ) AS v(email, base_user, programmer)
                     ON CONFLICT (email) DO UPDATE
                     SET base_user = app.user_privileges.base_user OR EXCLUDED.base_user,
                         reviewer = app.user_privileges.reviewer OR EXCLUDED.reviewer,
@@ -653,31 +1023,65 @@ def run_migration(args: argparse.Namespace) -> MigrationStats:
                     """
                 ),
                 {
-                    "email": resolved_email,
-                    "base_user": enabled,
-                    "reviewer": programmer,
-                    "admin": programmer,
-                    "creator": programmer,
+                    "emails": emails,
+                    "base_users": [flags[0] for flags in privileges_by_email.values()],
+                    "programmers": [flags[1] for flags in privileges_by_email.values()],
                 },
             )
             session.execute(
                 text(
                     """
-                    UPDATE app."user"
-                    SET is_active = :is_active
-                    WHERE lower(email) = lower(:email)
+                    UPDATE app."user" AS u
+                    SET is_active = v.is_active
+                    FROM UNNEST(CAST(:emails AS text[]), CAST(:is_active AS boolean[])) AS v(email, is_active)
+                    WHERE lower(u.email) = lower(v.email)
                     """
                 ),
-                {"is_active": enabled, "email": resolved_email},
+                {"emails": emails, "is_active": [flags[2] for flags in privileges_by_email.values()]},
             )
-            stats.privileges_synced += 1
         print(f"[migration] synced privileges rows: {stats.privileges_synced}", flush=True)
 
+        # Schema, clean-up, users and privileges land in one transaction; the row imports below
+        # commit every --commit-every rows. Every write is an upsert, so rerunning after a
+        # failure picks up where the last commit left off.
+        commit_every = max(0, int(args.commit_every))
+        if commit_every:
+            session.commit()
+
+        batch_size = max(1, int(args.batch_size))
+        last_progress_at = 0.0
+
+        def _progress_due(idx: int, total: int) -> bool:
+            # Time-throttled progress lines (plus the final one), independent of loop speed.
+            nonlocal last_progress_at
+            now = time.monotonic()
+            if idx != total and now - last_progress_at < _PROGRESS_INTERVAL_SECONDS:
+                return False
+            last_progress_at = now
+            return True
+
+        pending_cards: dict[str, dict[str, Any]] = {}
         person_id_by_slug: dict[str, int] = {}
+        # Known people/titles come from one query each; only new ones are inserted, per batch.
+        people_by_name = _load_people_ids(session)
+        titles_by_label = _load_title_ids(session)
+
+        def _flush_cards() -> None:
+            person_id_by_slug.update(
+                _upsert_card_batch(
+                    session,
+                    bucket=media_bucket,
+                    cards_by_slug=pending_cards,
+                    people_by_name=people_by_name,
+                    titles_by_label=titles_by_label,
+                )
+            )
+            pending_cards.clear()
+
         for idx, row in enumerate(cards, start=1):
             slug = _slugify(str(row.get("slug") or ""))
-            name = str(row.get("name") or "").strip() or slug
-            title = str(row.get("bucket") or "").strip() or "Unassigned"
+            name = _clean(row.get("name")) or slug
+            title = _clean(row.get("bucket")) or "Unassigned"
             markdown = _rewrite_image_paths_in_text(
                 str(row.get("markdown") or ""),
                 transform_image_url=transform_image_url,
@@ -686,99 +1090,79 @@ def run_migration(args: argparse.Namespace) -> MigrationStats:
             image_url = transform_image_url(row.get("image_url"))
             if not image_url:
                 image_url = "/images/Logo.png"
-            person_id = _upsert_person(session, name)
-            title_id = _upsert_title(session, title)
-            session.execute(
-                text(
-                    """
-                    INSERT INTO app.people_cards (slug, person_id, bucket, title_id, image_url)
-                    VALUES (:slug, :person_id, :bucket, :title_id, :image_url)
-                    ON CONFLICT (slug) DO UPDATE
-                    SET person_id = EXCLUDED.person_id,
-                        bucket = EXCLUDED.bucket,
-                        title_id = EXCLUDED.title_id,
-                        image_url = EXCLUDED.image_url,
-                        updated_at = now()
-                    """
-                ),
-                {
-                    "slug": slug,
-                    "person_id": person_id,
-                    "bucket": media_bucket,
-                    "title_id": title_id,
-                    "image_url": image_url,
-                },
-            )
-            session.execute(
-                text(
-                    """
-                    INSERT INTO app.people_articles (person_slug, markdown)
-                    VALUES (:person_slug, :markdown)
-                    ON CONFLICT (person_slug) DO UPDATE
-                    SET markdown = EXCLUDED.markdown,
-                        updated_at = now()
-                    """
-                ),
-                {"person_slug": slug, "markdown": markdown},
-            )
-            synced_tags = _sync_person_tags(session, person_id=person_id, tags=tags)
-            person_id_by_slug[slug] = int(person_id)
+            # A later row with the same slug wins, as it did with per-row upserts.
+            pending_cards[slug] = {
+                "name": name,
+                "title": title,
+                "tags": tuple(tags),
+                "image_url": image_url,
+                "markdown": markdown,
+            }
+            if len(pending_cards) >= batch_size or (commit_every and idx % commit_every == 0):
+                _flush_cards()
+                if commit_every:
+                    session.commit()
             stats.cards_upserted += 1
             stats.articles_upserted += 1
             stats.people_synced += 1
-            stats.tags_synced += synced_tags
-            if idx % 5 == 0 or idx == len(cards):
+            stats.tags_synced += len(tags)
+            if _progress_due(idx, len(cards)):
                 print(
                     f"[migration] cards processed: {idx}/{len(cards)} (images uploaded={stats.images_uploaded}, reused={stats.images_reused})",
                     flush=True,
                 )
+        _flush_cards()
+
+        # Proposals may point at cards that were already on the target but not in this import;
+        # one query covers them all instead of a lookup per orphan proposal.
+        for card_slug, card_person_id in session.execute(text("SELECT slug, person_id FROM app.people_cards")):
+            person_id_by_slug.setdefault(card_slug, int(card_person_id))
 
         migrated_proposal_ids: set[int] = set()
+        pending_proposals: list[tuple[Any, ...]] = []
+
+        def _flush_proposals() -> None:
+            _execute_unnest_batch(
+                session,
+                _SQL_UPSERT_PROPOSALS,
+                pending_proposals,
+                (
+                    "ids",
+                    "person_slugs",
+                    "person_ids",
+                    "proposer_user_ids",
+                    "proposal_scopes",
+                    "base_payloads",
+                    "proposed_payloads",
+                    "notes",
+                    "statuses",
+                    "created_ats",
+                    "reviewed_ats",
+                    "reviewer_user_ids",
+                    "review_notes",
+                    "report_triggereds",
+                ),
+            )
+            pending_proposals.clear()
+
         for idx, row in enumerate(proposals, start=1):
             proposal_id = int(row.get("id") or 0)
             if proposal_id <= 0:
                 continue
             person_slug = _slugify(str(row.get("person_slug") or ""))
             person_id_for_diff = int(person_id_by_slug.get(person_slug) or 0)
-            if person_id_for_diff <= 0:
-                person_id_for_diff = int(
-                    session.execute(
-                        text(
-                            """
-                            SELECT person_id
-                            FROM app.people_cards
-                            WHERE slug = :person_slug
-                            LIMIT 1
-                            """
-                        ),
-                        {"person_slug": person_slug},
-                    ).scalar_one_or_none()
-                    or 0
-                )
-                if person_id_for_diff > 0:
-                    person_id_by_slug[person_slug] = person_id_for_diff
-            proposer_email = str(row.get("proposer_email") or "").strip().lower()
-            proposer_name = str(row.get("proposer_name") or "").strip()
+            proposer_email = _clean(row.get("proposer_email")).lower()
+            proposer_name = _clean(row.get("proposer_name"))
             if not proposer_email:
                 stats.warn(f"Skipping proposal id={proposal_id} without proposer_email.")
                 continue
 
-            proposer_user_id, proposer_email, _ = ensure_user(
-                session,
-                user_identifier=proposer_email,
-                display_name=proposer_name or proposer_email.split("@", 1)[0],
-            )
-            user_id_by_email[proposer_email.lower()] = int(proposer_user_id)
+            proposer_user_id = _user_id(session, proposer_email, proposer_name or proposer_email.split("@", 1)[0])
 
             reviewer_user_id: int | None = None
-            reviewer_email = str(row.get("reviewer_email") or "").strip().lower()
+            reviewer_email = _clean(row.get("reviewer_email")).lower()
             if reviewer_email:
-                reviewer_user_id, reviewer_email, _ = ensure_user(
-                    session,
-                    user_identifier=reviewer_email,
-                    display_name=reviewer_email.split("@", 1)[0],
-                )
-                user_id_by_email[reviewer_email.lower()] = int(reviewer_user_id)
+                reviewer_user_id = _user_id(session, reviewer_email, reviewer_email.split("@", 1)[0])
 
             scope = normalize_proposal_scope(row.get("proposal_scope"))
             base_markdown = _rewrite_image_paths_in_text(
@@ -794,80 +1178,11 @@ def run_migration(args: argparse.Namespace) -> MigrationStats:
             created_at = _parse_timestamp(row.get("created_at"))
             reviewed_at = _parse_timestamp(row.get("reviewed_at"))
             status = _normalize_status(row.get("status"))
-            note = str(row.get("note") or "").strip()
-            review_note = str(row.get("review_note") or "").strip()
+            note = _clean(row.get("note"))
+            review_note = _clean(row.get("review_note"))
             report_triggered = 1 if int(row.get("report_triggered") or 0) else 0
 
-            session.execute(
-                text(
-                    """
-                    INSERT INTO app.people_change_proposals (
-                        id,
-                        person_slug,
-                        person_id,
-                        proposer_user_id,
-                        proposal_scope,
-                        base_payload,
-                        proposed_payload,
-                        note,
-                        status,
-                        created_at,
-                        reviewed_at,
-                        reviewer_user_id,
-                        review_note,
-                        report_triggered
-                    )
-                    VALUES (
-                        :id,
-                        :person_slug,
-                        :person_id,
-                        :proposer_user_id,
-                        :proposal_scope,
-                        :base_payload,
-                        :proposed_payload,
-                        :note,
-                        :status,
-                        COALESCE(:created_at, now()),
-                        :reviewed_at,
-                        :reviewer_user_id,
-                        :review_note,
-                        :report_triggered
-                    )
-                    ON CONFLICT (id) DO UPDATE
-                    SET person_slug = EXCLUDED.person_slug,
-                        person_id = EXCLUDED.person_id,
-                        proposer_user_id = EXCLUDED.proposer_user_id,
-                        proposal_scope = EXCLUDED.proposal_scope,
-                        base_payload = EXCLUDED.base_payload,
-                        proposed_payload = EXCLUDED.proposed_payload,
-                        note = EXCLUDED.note,
-                        status = EXCLUDED.status,
-                        created_at = EXCLUDED.created_at,
-                        reviewed_at = EXCLUDED.reviewed_at,
-                        reviewer_user_id = EXCLUDED.reviewer_user_id,
-                        review_note = EXCLUDED.review_note,
-                        report_triggered = EXCLUDED.report_triggered
-                    """
-                ),
-                {
-                    "id": proposal_id,
-                    "person_slug": person_slug,
-                    "person_id": person_id_for_diff,
-                    "proposer_user_id": int(proposer_user_id),
-                    "proposal_scope": scope,
-                    "base_payload": base_markdown,
-                    "proposed_payload": proposed_markdown,
-                    "note": note,
-                    "status": status,
-                    "created_at": created_at,
-                    "reviewed_at": reviewed_at,
-                    "reviewer_user_id": int(reviewer_user_id) if reviewer_user_id else None,
-                    "review_note": review_note,
-                    "report_triggered": report_triggered,
-                },
-            )
-            _upsert_diff_payload_qualified(
-                session,
+            base_payload, proposed_payload = _qualified_diff_payloads(
                 proposal_id=proposal_id,
                 person_id=person_id_for_diff,
                 scope=scope,
@@ -876,14 +1191,48 @@ def run_migration(args: argparse.Namespace) -> MigrationStats:
                 base_image_url=base_image_url,
                 proposed_image_url=proposed_image_url,
             )
+            pending_proposals.append(
+                (
+                    proposal_id,
+                    person_slug,
+                    person_id_for_diff,
+                    int(proposer_user_id),
+                    scope,
+                    base_payload,
+                    proposed_payload,
+                    note,
+                    status,
+                    created_at,
+                    reviewed_at,
+                    int(reviewer_user_id) if reviewer_user_id else None,
+                    review_note,
+                    report_triggered,
+                )
+            )
             migrated_proposal_ids.add(proposal_id)
             stats.proposals_upserted += 1
             if scope == "card":
                 stats.card_diffs_upserted += 1
             else:
                 stats.article_diffs_upserted += 1
-            if idx % 5 == 0 or idx == len(proposals):
+            if len(pending_proposals) >= batch_size or (commit_every and idx % commit_every == 0):
+                _flush_proposals()
+                if commit_every:
+                    session.commit()
+            if _progress_due(idx, len(proposals)):
                 print(f"[migration] proposals processed: {idx}/{len(proposals)}", flush=True)
+        _flush_proposals()
+
+        pending_events: list[tuple[Any, ...]] = []
+
+        def _flush_events() -> None:
+            _execute_unnest_batch(
+                session,
+                _SQL_UPSERT_EVENTS,
+                pending_events,
+                ("ids", "proposal_ids", "event_types", "actor_user_ids", "notes", "payload_jsons", "created_ats"),
+            )
+            pending_events.clear()
 
         for idx, row in enumerate(events, start=1):
             event_id = int(row.get("id") or 0)
@@ -897,70 +1246,38 @@ def run_migration(args: argparse.Namespace) -> MigrationStats:
                 continue
 
             actor_user_id: int | None = None
-            actor_email = str(row.get("actor_email") or "").strip().lower()
-            actor_name = str(row.get("actor_name") or "").strip()
+            actor_email = _clean(row.get("actor_email")).lower()
+            actor_name = _clean(row.get("actor_name"))
             if actor_email:
-                if actor_email in user_id_by_email:
-                    actor_user_id = user_id_by_email[actor_email]
-                else:
-                    actor_user_id, resolved_email, _ = ensure_user(
-                        session,
-                        user_identifier=actor_email,
-                        display_name=actor_name or actor_email.split("@", 1)[0],
-                    )
-                    user_id_by_email[resolved_email.lower()] = int(actor_user_id)
+                actor_user_id = _user_id(session, actor_email, actor_name or actor_email.split("@", 1)[0])
 
             payload_json = _rewrite_payload_json(
                 str(row.get("payload_json") or "{}"),
                 transform_image_url=transform_image_url,
             )
             created_at = _parse_timestamp(row.get("created_at"))
-            notes = str(row.get("notes") or "").strip()
-            event_type = str(row.get("event_type") or "").strip() or "unknown"
-
-            session.execute(
-                text(
-                    """
-                    INSERT INTO app.people_change_events (
-                        id,
-                        proposal_id,
-                        event_type,
-                        actor_user_id,
-                        notes,
-                        payload_json,
-                        created_at
-                    )
-                    VALUES (
-                        :id,
-                        :proposal_id,
-                        :event_type,
-                        :actor_user_id,
-                        :notes,
-                        :payload_json,
-                        COALESCE(:created_at, now())
-                    )
-                    ON CONFLICT (id) DO UPDATE
-                    SET proposal_id = EXCLUDED.proposal_id,
-                        event_type = EXCLUDED.event_type,
-                        actor_user_id = EXCLUDED.actor_user_id,
-                        notes = EXCLUDED.notes,
-                        payload_json = EXCLUDED.payload_json,
-                        created_at = EXCLUDED.created_at
-                    """
-                ),
-                {
-                    "id": event_id,
-                    "proposal_id": proposal_id,
-                    "event_type": event_type,
-                    "actor_user_id": int(actor_user_id) if actor_user_id else None,
-                    "notes": notes,
-                    "payload_json": payload_json,
-                    "created_at": created_at,
-                },
+            notes = _clean(row.get("notes"))
+            event_type = _clean(row.get("event_type")) or "unknown"
+
+            pending_events.append(
+                (
+                    event_id,
+                    proposal_id,
+                    event_type,
+                    int(actor_user_id) if actor_user_id else None,
+                    notes,
+                    payload_json,
+                    created_at,
+                )
             )
             stats.events_upserted += 1
-            if idx % 10 == 0 or idx == len(events):
+            if len(pending_events) >= batch_size or (commit_every and idx % commit_every == 0):
+                _flush_events()
+                if commit_every:
+                    session.commit()
+            if _progress_due(idx, len(events)):
                 print(f"[migration] events processed: {idx}/{len(events)}", flush=True)
+        _flush_events()
 
         session.execute(
             text(
@@ -1045,6 +1362,24 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Do not upload image files (URLs are still rewritten deterministically).",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=_DEFAULT_BATCH_SIZE,
+        help="Cards/articles, proposals or events written per multi-row upsert statement.",
+    )
+    parser.add_argument(
+        "--commit-every",
+        type=int,
+        default=_DEFAULT_COMMIT_EVERY,
+        help="Commit after every N imported cards/proposals/events (0 keeps the whole import in one transaction).",
+    )
+    parser.add_argument(
+        "--upload-concurrency",
+        type=int,
+        default=_DEFAULT_UPLOAD_CONCURRENCY,
+        help="Worker threads hashing/probing/uploading local images before the DB import.",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
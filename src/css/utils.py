@@ -1,10 +1,19 @@
+import os
 import pathlib
+from functools import lru_cache
 
 CSS_DIR = pathlib.Path(__file__).parent
 
 def load_css(name: str) -> str:
+    # Stylesheets are read once per process; DEBUG_CSS_RELOAD=1 re-reads them on every call.
+    if str(os.getenv("DEBUG_CSS_RELOAD") or "").strip().lower() in {"1", "true", "yes", "on"}:
+        _read_css.cache_clear()
+    return _read_css(name)
+
+@lru_cache(maxsize=None)
+def _read_css(name: str) -> str:
     path = CSS_DIR / name
     try:
         return path.read_text(encoding="utf-8")
     except FileNotFoundError:
-        return f"/* missing CSS file: {name} */"
\ No newline at end of file
+        return f"/* missing CSS file: {name} */"
@@ -25,6 +25,7 @@ _ENGINE: Engine | None = None
 _SessionLocal: sessionmaker | None = None
 _CLOUD_SQL_CONNECTOR = None
 _QUERY_START_KEY = "page_timing_query_start"
+_NON_CODE_CHARS_RE = re.compile(r"[^a-z0-9]+")
 
 
 def _format_sql_for_log(statement: str) -> str:
@@ -86,10 +87,34 @@ def _resolve_database_url() -> str:
     return DEFAULT_DB_URL
 
 
+def _sql_timing_enabled() -> bool:
+    # On by default; batch jobs set DB_QUERY_TIMING=0 to keep the listeners off the engine entirely.
+    return _is_truthy(os.getenv("DB_QUERY_TIMING", "1"))
+
+
+def _engine_options() -> dict[str, object]:
+    """
+    Pool settings shared by every engine. DB_POOL_PRE_PING=0 drops the per-checkout `SELECT 1`
+    (single-session batch jobs); DB_POOL_SIZE / DB_POOL_MAX_OVERFLOW override SQLAlchemy's pool sizing.
+    """
+    options: dict[str, object] = {
+        "pool_pre_ping": _is_truthy(os.getenv("DB_POOL_PRE_PING", "1")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE") or "1800"),
+        "future": True,
+    }
+    for env_name, option in (("DB_POOL_SIZE", "pool_size"), ("DB_POOL_MAX_OVERFLOW", "max_overflow")):
+        raw_value = os.getenv(env_name)
+        if raw_value:
+            options[option] = int(raw_value)
+    return options
+
+
 def _attach_sql_timing(engine: Engine) -> None:
     if getattr(engine, "_page_timing_attached", False):
         return
     setattr(engine, "_page_timing_attached", True)
+    if not _sql_timing_enabled():
+        return
 
     @event.listens_for(engine, "before_cursor_execute")
     def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
@@ -105,6 +130,8 @@ def _attach_sql_timing(engine: Engine) -> None:
         start = start_times.pop()
         elapsed = time.perf_counter() - start
         record_sql_time(elapsed)
+        if not timing_logger.isEnabledFor(logging.INFO):
+            return
         timing_logger.info(
             "db.query.timing ms=%.2f rows=%s stmt=%s",
             elapsed * 1000.0,
@@ -134,7 +161,7 @@ def _build_engine() -> Engine:
             _assert_not_local_target(url.host, source="DATABASE_URL")
             logger.warning("Database target from DATABASE_URL: %s", _sanitize_url(url))
             step_start = time.perf_counter()
-            engine = create_engine(url, pool_pre_ping=True, future=True)
+            engine = create_engine(url, **_engine_options())
             _log_duration("create_engine.database_url", step_start)
             _attach_sql_timing(engine)
             _attach_connection_defaults(engine)
@@ -158,7 +185,7 @@ def _build_engine() -> Engine:
         url = make_url(_resolve_database_url())
         logger.warning("Database target from PGHOST/DB_HOST: %s", _sanitize_url(url))
         step_start = time.perf_counter()
-        engine = create_engine(url, pool_pre_ping=True, future=True)
+        engine = create_engine(url, **_engine_options())
         _log_duration("create_engine.pghost", step_start)
         _attach_sql_timing(engine)
         _attach_connection_defaults(engine)
@@ -177,7 +204,7 @@ def _build_engine() -> Engine:
         _sanitize_url(url),
     )
     step_start = time.perf_counter()
-    engine = create_engine(url, pool_pre_ping=True, future=True)
+    engine = create_engine(url, **_engine_options())
     _log_duration("create_engine.default_fallback", step_start)
     _attach_sql_timing(engine)
     _attach_connection_defaults(engine)
@@ -229,7 +256,7 @@ def _build_cloud_sql_engine(instance_name: str) -> Engine:
         ip_type.name.lower(),
     )
     create_start = time.perf_counter()
-    engine = create_engine("postgresql+pg8000://", creator=getconn, pool_pre_ping=True, future=True)
+    engine = create_engine("postgresql+pg8000://", creator=getconn, **_engine_options())
     _log_duration("cloud_sql.create_engine", create_start)
     _attach_sql_timing(engine)
     _attach_connection_defaults(engine)
@@ -246,6 +273,35 @@ def get_engine() -> Engine:
     return _ENGINE
 
 
+def _ensure_user_privileges_schema(engine: Engine) -> None:
+    """
+    One-time fix-ups for app.user_privileges that `ensure_user` used to re-run on every call:
+    the editor/admin/creator columns and the legacy reviewer_creator -> admin backfill.
+    """
+    statements = (
+        "ALTER TABLE IF EXISTS app.user_privileges ADD COLUMN IF NOT EXISTS editor BOOLEAN NOT NULL DEFAULT FALSE",
+        "ALTER TABLE IF EXISTS app.user_privileges ADD COLUMN IF NOT EXISTS admin BOOLEAN NOT NULL DEFAULT FALSE",
+        "ALTER TABLE IF EXISTS app.user_privileges ADD COLUMN IF NOT EXISTS creator BOOLEAN NOT NULL DEFAULT FALSE",
+    )
+    try:
+        with engine.begin() as connection:
+            for statement in statements:
+                connection.execute(text(statement))
+            if connection.execute(text("SELECT to_regclass('app.user_privileges')")).scalar() is not None:
+                connection.execute(
+                    text(
+                        """
+                        UPDATE app.user_privileges AS p
+                        SET admin = TRUE
+                        WHERE p.admin = FALSE
+                          AND COALESCE((to_jsonb(p) ->> 'reviewer_creator')::boolean, FALSE)
+                        """
+                    )
+                )
+    except Exception as exc:
+        logger.warning("Could not ensure app.user_privileges columns: %s", exc)
+
+
 def get_session_factory() -> sessionmaker:
     global _SessionLocal
     if _SessionLocal is None:
@@ -259,6 +315,9 @@ def get_session_factory() -> sessionmaker:
         except Exception as exc:
             logger.error("Database connectivity check failed: %s", exc)
             raise
+        schema_start = time.perf_counter()
+        _ensure_user_privileges_schema(engine)
+        _log_duration("session_factory.user_privileges_schema", schema_start)
         factory_start = time.perf_counter()
         _SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
         _log_duration("session_factory.create", factory_start)
@@ -330,5 +389,5 @@ def make_code(value: str, default_prefix: str = "code") -> str:
     Ensures the value is not empty by falling back to the provided prefix.
     """
     value = value.strip().lower()
-    slug = re.sub(r"[^a-z0-9]+", "-", value).strip("-")
+    slug = _NON_CODE_CHARS_RE.sub("-", value).strip("-")
     return slug or default_prefix
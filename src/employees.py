@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 
 from sqlalchemy import text
 from sqlalchemy.engine import RowMapping
@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 from src.db import make_code
 
 _PLACEHOLDER_DOMAIN = "placeholder.local"
+_USER_CACHE_KEY = "employees.user_cache"
 
 
 def normalize_email(raw: Optional[str], *, default_prefix: str = "user") -> str:
@@ -23,6 +24,19 @@ def normalize_email(raw: Optional[str], *, default_prefix: str = "user") -> str:
     return f"{slug}@{_PLACEHOLDER_DOMAIN}"
 
 
+def _session_user_cache(session: Session) -> Dict[Tuple[str, ...], object]:
+    """
+    Per-session memo of user upserts/lookups, reset whenever the session starts a new transaction
+    so a rollback never leaves ids behind for rows that were not kept.
+    """
+    transaction = session.get_transaction()
+    cached = session.info.get(_USER_CACHE_KEY)
+    if cached is None or cached[0] is not transaction:
+        cached = (transaction, {})
+        session.info[_USER_CACHE_KEY] = cached
+    return cached[1]
+
+
 def ensure_user(
     session: Session,
     *,
@@ -35,6 +49,11 @@ def ensure_user(
     email = normalize_email(user_identifier or display_name)
     name = (display_name or "").strip() or email.split("@", 1)[0]
     username = name
+    # Keyed by email with the last name written, so a different display name still updates the row.
+    cache_key = ("ensure", email)
+    cached = _session_user_cache(session).get(cache_key)
+    if cached is not None and cached[0] == name:
+        return cached[1]
 
     row = session.execute(
         text(
@@ -52,54 +71,69 @@ def ensure_user(
 
     resolved_email = row["email"]
 
+    # Every newly registered account starts with base_user + editor access.
+    # Keep existing records unchanged (e.g. if a creator removed privileges later on purpose).
     session.execute(
         text(
             """
-            ALTER TABLE app.user_privileges
-            ADD COLUMN IF NOT EXISTS editor BOOLEAN NOT NULL DEFAULT FALSE
-            """
-        )
-    )
-    session.execute(
-        text(
-            """
-            ALTER TABLE app.user_privileges
-            ADD COLUMN IF NOT EXISTS admin BOOLEAN NOT NULL DEFAULT FALSE
-            """
-        )
-    )
-    session.execute(
-        text(
-            """
-            ALTER TABLE app.user_privileges
-            ADD COLUMN IF NOT EXISTS creator BOOLEAN NOT NULL DEFAULT FALSE
+            INSERT INTO app.user_privileges (email, base_user, editor)
+            VALUES (:email, TRUE, TRUE)
+            ON CONFLICT (email) DO NOTHING
             """
-        )
+        ),
+        {"email": resolved_email},
     )
-    session.execute(
+
+    result = (int(row["id"]), resolved_email, row["name"])
+    cache = _session_user_cache(session)
+    cache[cache_key] = (name, result)
+    cache[("id", resolved_email.lower())] = result[0]
+    return result
+
+
+def ensure_users(
+    session: Session,
+    users: Iterable[Tuple[str, Optional[str]]],
+) -> Dict[str, int]:
+    """
+    Bulk `ensure_user` over (user_identifier, display_name) pairs; returns resolved email -> user id.
+    A repeated identifier keeps its last display name, as sequential `ensure_user` calls would.
+    """
+    names_by_email: Dict[str, str] = {}
+    for user_identifier, display_name in users:
+        email = normalize_email(user_identifier or display_name)
+        names_by_email[email] = (display_name or "").strip() or email.split("@", 1)[0]
+    if not names_by_email:
+        return {}
+
+    names = list(names_by_email.values())
+    rows = session.execute(
         text(
             """
-            UPDATE app.user_privileges AS p
-            SET admin = TRUE
-            WHERE p.admin = FALSE
-              AND COALESCE((to_jsonb(p) ->> 'reviewer_creator')::boolean, FALSE)
+            INSERT INTO app."user" (name, username, email)
+            SELECT v.name, v.name, v.email
+            FROM UNNEST(CAST(:names AS text[]), CAST(:emails AS text[])) AS v(name, email)
+            ON CONFLICT (email) DO UPDATE
+            SET name = EXCLUDED.name,
+                username = COALESCE("user".username, EXCLUDED.username)
+            RETURNING id, email
             """
-        )
-    )
-    # Every newly registered account starts with base_user + editor access.
-    # Keep existing records unchanged (e.g. if a creator removed privileges later on purpose).
+        ),
+        {"names": names, "emails": list(names_by_email)},
+    ).all()
+    user_ids = {str(email): int(user_id) for user_id, email in rows}
+
     session.execute(
         text(
             """
             INSERT INTO app.user_privileges (email, base_user, editor)
-            VALUES (:email, TRUE, TRUE)
+            SELECT UNNEST(CAST(:emails AS text[])), TRUE, TRUE
             ON CONFLICT (email) DO NOTHING
             """
         ),
-        {"email": resolved_email},
+        {"emails": list(user_ids)},
     )
-
-    return int(row["id"]), resolved_email, row["name"]
+    return user_ids
 
 
 def ensure_employee(
@@ -141,7 +175,11 @@ def lookup_technician_id_by_email(session: Session, email: Optional[str]) -> Opt
     email = (email or "").strip()
     if not email:
         return None
-    return session.execute(
+    cache_key = ("id", email.lower())
+    cache = _session_user_cache(session)
+    if cache_key in cache:
+        return cache[cache_key]
+    user_id = session.execute(
         text(
             """
             SELECT id
@@ -151,6 +189,9 @@ def lookup_technician_id_by_email(session: Session, email: Optional[str]) -> Opt
         ),
         {"email": email},
     ).scalar_one_or_none()
+    if user_id is not None:
+        _session_user_cache(session)[cache_key] = user_id
+    return user_id
 
 
 def lookup_radiologist_id_by_email(session: Session, email: Optional[str]) -> Optional[int]:
@@ -3,17 +3,22 @@ from __future__ import annotations
 import json
 import os
 from datetime import datetime, timedelta
-from typing import Any, Dict, Iterable, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
 from urllib.parse import quote
 
-from google.api_core.exceptions import NotFound
+import google.auth
+from google.api_core.exceptions import NotFound, PreconditionFailed, RequestRangeNotSatisfiable
+from google.auth.credentials import AnonymousCredentials, with_scopes_if_required
+from google.auth.transport.requests import AuthorizedSession
 from google.cloud import storage
 from google.oauth2 import service_account
+from requests.adapters import HTTPAdapter
 
 
 # Defaults can be overridden via env vars without touching code
 DEFAULT_BUCKET = os.getenv("BUCKET_NAME") or os.getenv("API_STORAGE_BUCKET", "api_information_storage")
 DEFAULT_KEYFILE = os.getenv("API_BUCKET_KEY_FILE", "secrets/api_bucket_db_key.json")
+DEFAULT_STREAM_CHUNK_SIZE = 1024 * 1024
 
 
 def _credentials():
@@ -32,11 +37,27 @@ def _credentials():
     return None
 
 
-def storage_client() -> storage.Client:
+def storage_client(*, http_pool_size: Optional[int] = None) -> storage.Client:
+    """
+    `http_pool_size` gives the client its own authorized HTTP session whose connection pool holds
+    that many connections, so that many parallel transfers don't queue for a connection.
+    """
     creds = _credentials()
+    if http_pool_size is None:
+        if creds is not None:
+            return storage.Client(credentials=creds, project=creds.project_id)
+        return storage.Client()  # ADC
+
     if creds is not None:
-        return storage.Client(credentials=creds, project=creds.project_id)
-    return storage.Client()  # ADC
+        project = creds.project_id
+    elif os.getenv("STORAGE_EMULATOR_HOST"):
+        creds, project = AnonymousCredentials(), None
+    else:
+        creds, project = google.auth.default()
+    creds = with_scopes_if_required(creds, storage.Client.SCOPE)
+    session = AuthorizedSession(creds)
+    session.mount("https://", HTTPAdapter(pool_connections=http_pool_size, pool_maxsize=http_pool_size))
+    return storage.Client(credentials=creds, project=project, _http=session)
 
 
 def get_bucket(name: Optional[str] = None) -> storage.Bucket:
@@ -75,9 +96,12 @@ def download_with_metadata(blob_name: str) -> tuple[bytes, Optional[str]]:
     return payload, blob.content_type
 
 
-def blob_http_metadata(blob_name: str) -> tuple[Optional[str], Optional[str], Optional[datetime]]:
+def blob_http_metadata(
+    blob_name: str,
+) -> tuple[Optional[str], Optional[str], Optional[datetime], Optional[int], Optional[int]]:
     """
-    Return (content_type, etag, updated_at_utc) for a blob without downloading payload bytes.
+    Return (content_type, etag, updated_at_utc, size_bytes, generation) for a blob without downloading
+    payload bytes.
     Raises FileNotFoundError when the blob does not exist.
     """
     client = storage_client()
@@ -87,7 +111,7 @@ def blob_http_metadata(blob_name: str) -> tuple[Optional[str], Optional[str], Op
         blob.reload(client=client)
     except NotFound:
         raise FileNotFoundError(blob_name)
-    return blob.content_type, blob.etag, blob.updated
+    return blob.content_type, blob.etag, blob.updated, blob.size, blob.generation
 
 
 def upload_fileobj(fileobj, blob_name: str, *, content_type: Optional[str] = None, cache_seconds: int = 0) -> str:
@@ -110,6 +134,42 @@ def download_bytes(blob_name: str) -> bytes:
         raise FileNotFoundError(blob_name)
 
 
+def download_stream(
+    blob_name: str,
+    *,
+    start: int = 0,
+    end: Optional[int] = None,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    generation: Optional[int] = None,
+) -> Iterator[bytes]:
+    """
+    Yield blob bytes from `start` through the inclusive `end` offset in ranged reads of `chunk_size`.
+    With `generation`, every ranged read is pinned to that object generation, so the chunks can
+    never mix two versions of an overwritten blob.
+    Raises FileNotFoundError when the blob (or the pinned generation) no longer exists.
+    """
+    client = storage_client()
+    bucket = client.bucket(DEFAULT_BUCKET)
+    blob = bucket.blob(blob_name, generation=generation)
+    position = max(0, int(start))
+    while end is None or position <= end:
+        chunk_end = position + chunk_size - 1
+        if end is not None:
+            chunk_end = min(chunk_end, end)
+        try:
+            chunk = blob.download_as_bytes(client=client, start=position, end=chunk_end, checksum=None)
+        except (NotFound, PreconditionFailed):
+            raise FileNotFoundError(blob_name)
+        except RequestRangeNotSatisfiable:
+            return
+        if not chunk:
+            return
+        yield chunk
+        if len(chunk) < chunk_end - position + 1:
+            return
+        position += len(chunk)
+
+
 def delete_prefix(prefix: str) -> int:
     """Delete all blobs under the prefix. Returns count deleted."""
     client = storage_client()
@@ -1,13 +1,20 @@
 # src/mount_gradio_app.py
+import asyncio
+import contextlib
+import importlib
 import logging
 import os
 import re
+import time
 from pathlib import Path
 
+from fastapi import FastAPI
 from starlette.requests import Request
-from starlette.responses import RedirectResponse
+from starlette.responses import PlainTextResponse, RedirectResponse
+from starlette.routing import BaseRoute, Match, Mount, NoMatchFound
 import gradio as gr
 from starlette.middleware.sessions import SessionMiddleware
+from starlette.websockets import WebSocketClose
 
 from src.login_logic import add_login_routes, get_user
 from src.secrets import get_secret
@@ -203,16 +210,150 @@ def add_middleware_redirect(app, app_route: str):
         # Non-matching paths: pass through
         return await call_next(request)
 
-def mount_gradio_app(*args, secret_key: str | None = None, **kwargs):
+def add_session_middleware(app, secret_key: str | None = None) -> None:
+    """
+    Install one app-wide SessionMiddleware. Call it after the last mount: Starlette wraps
+    later middleware around earlier ones, and the auth middleware needs `request.session`.
+    """
+    # session secret via get_secret (env locally, Secret Manager on GCP)
+    secret = secret_key or get_secret("SESSION_SECRET", default="dev-session-secret")
+    app.add_middleware(SessionMiddleware, secret_key=secret)
+
+
+def mount_gradio_app(*args, secret_key: str | None = None, session_middleware: bool = True, **kwargs):
     app = args[0]
     path = args[2]
 
     _patch_gradio_upload_chunk_size()
     add_middleware_redirect(app, path)
     add_login_routes(app, path)
-
-    # session secret via get_secret (env locally, Secret Manager on GCP)
-    secret = secret_key or get_secret("SESSION_SECRET", default="dev-session-secret")
-    app.add_middleware(SessionMiddleware, secret_key=secret)
+    if session_middleware:
+        add_session_middleware(app, secret_key)
 
     return gr.mount_gradio_app(*args, **kwargs)
+
+
+class MountTable(BaseRoute):
+    """
+    One route-table entry holding many prefix mounts, picked by the first path segment with a
+    dict lookup instead of Starlette's linear walk over one `Mount` per page.
+    """
+
+    def __init__(self):
+        self.mounts: dict[str, Mount] = {}
+
+    def mount(self, path: str, app, name: str | None = None) -> None:
+        mount = Mount(path, app=app, name=name)
+        self.mounts[mount.path] = mount
+
+    def matches(self, scope):
+        if scope["type"] not in ("http", "websocket"):
+            return Match.NONE, {}
+        path = scope["path"]
+        root_path = scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path):]
+        mount = self.mounts.get("/" + path.lstrip("/").split("/", 1)[0])
+        if mount is None:
+            return Match.NONE, {}
+        return mount.matches(scope)
+
+    def url_path_for(self, name: str, /, **path_params):
+        # Same contract as `Router.url_path_for`: NoMatchFound lets the router try later routes.
+        for mount in self.mounts.values():
+            try:
+                return mount.url_path_for(name, **path_params)
+            except NoMatchFound:
+                continue
+        raise NoMatchFound(name, path_params)
+
+    async def handle(self, scope, receive, send):
+        # `Mount.matches` put the matched child app in the scope.
+        await scope["endpoint"](scope, receive, send)
+
+    def __repr__(self) -> str:
+        return f"MountTable({sorted(self.mounts)})"
+
+
+class _LazyGradioApp:
+    """
+    ASGI app that imports and builds a Gradio Blocks factory on the first request it receives.
+    The import and build run in a worker thread so other requests keep being served meanwhile.
+    The Blocks are mounted on a private FastAPI app whose lifespan (queue startup) is entered here,
+    since the outer app has already finished its own startup by then.
+    A failed build is logged once and answered with 503 until LAZY_APP_RETRY_SECONDS have passed.
+    """
+
+    RETRY_SECONDS = float(os.getenv("LAZY_APP_RETRY_SECONDS") or "30")
+
+    def __init__(self, module_name: str, factory_name: str, **mount_kwargs):
+        self.module_name = module_name
+        self.factory_name = factory_name
+        self.mount_kwargs = mount_kwargs
+        self._app = None
+        self._failed_until = 0.0
+        self._lock = asyncio.Lock()
+        self._lifespan = contextlib.AsyncExitStack()
+
+    def _build(self) -> FastAPI:
+        factory = getattr(importlib.import_module(self.module_name), self.factory_name)
+        sub_app = FastAPI()
+        gr.mount_gradio_app(sub_app, factory(), "/", **self.mount_kwargs)
+        return sub_app
+
+    async def _load(self):
+        async with self._lock:
+            if self._app is None and time.monotonic() >= self._failed_until:
+                try:
+                    sub_app = await asyncio.to_thread(self._build)
+                    await self._lifespan.enter_async_context(sub_app.router.lifespan_context(sub_app))
+                except Exception:
+                    self._failed_until = time.monotonic() + self.RETRY_SECONDS
+                    logger.exception("Could not build Gradio app %s.%s.", self.module_name, self.factory_name)
+                else:
+                    logger.info("Mounted Gradio app %s.%s on first request.", self.module_name, self.factory_name)
+                    self._app = sub_app
+        return self._app
+
+    async def __call__(self, scope, receive, send):
+        app = self._app or await self._load()
+        if app is None:
+            if scope["type"] == "websocket":
+                await WebSocketClose(code=1011)(scope, receive, send)
+            else:
+                await PlainTextResponse("Page temporarily unavailable", status_code=503)(scope, receive, send)
+            return
+        await app(scope, receive, send)
+
+    async def aclose(self) -> None:
+        await self._lifespan.aclose()
+
+
+def mount_lazy_gradio_app(
+    app,
+    module_name: str,
+    factory_name: str,
+    path: str,
+    *,
+    secret_key: str | None = None,
+    session_middleware: bool = True,
+    wrapper=None,
+    router=None,
+    **kwargs,
+):
+    """
+    Same auth/session wiring as `mount_gradio_app`, but `module_name.factory_name()` is only
+    imported and built when the first request under `path` arrives.
+    `wrapper`, when given, wraps the lazy ASGI app before it is mounted (e.g. path-local redirects);
+    `router` (e.g. a `MountTable`) receives the mount instead of `app`.
+    """
+    _patch_gradio_upload_chunk_size()
+    add_middleware_redirect(app, path)
+    add_login_routes(app, path)
+    if session_middleware:
+        add_session_middleware(app, secret_key)
+
+    lazy_app = _LazyGradioApp(module_name, factory_name, **kwargs)
+    (router or app).mount(path, wrapper(lazy_app) if wrapper else lazy_app)
+    app.add_event_handler("shutdown", lazy_app.aclose)
+    return app
@@ -546,18 +546,34 @@ def _ensure_unsorted_db_once() -> None:
             )
         )
 
-        session.execute(text("CREATE INDEX IF NOT EXISTS idx_unsorted_files_created_at ON app.unsorted_files(created_at)"))
+        # unsorted_files is append-only, so created_at follows heap order and BRIN replaces the old btree.
+        session.execute(text("DROP INDEX IF EXISTS app.idx_unsorted_files_created_at"))
         session.execute(
-            text("CREATE INDEX IF NOT EXISTS idx_unsorted_files_uploaded_by ON app.unsorted_files(uploaded_by_user_id)")
+            text(
+                "CREATE INDEX IF NOT EXISTS idx_unsorted_files_created_at_brin "
+                "ON app.unsorted_files USING BRIN (created_at) WITH (pages_per_range = 16)"
+            )
         )
         session.execute(
-            text("CREATE INDEX IF NOT EXISTS idx_unsorted_actions_file_id ON app.unsorted_file_actions(unsorted_file_id)")
+            text("CREATE INDEX IF NOT EXISTS idx_unsorted_files_uploaded_by ON app.unsorted_files(uploaded_by_user_id)")
         )
+        # The unique (unsorted_file_id, actor_user_id, action_type) index already serves file-id lookups.
+        session.execute(text("DROP INDEX IF EXISTS app.idx_unsorted_actions_file_id"))
+        session.execute(text("DROP INDEX IF EXISTS app.idx_unsorted_actions_actor"))
+        session.execute(text("DROP INDEX IF EXISTS app.idx_unsorted_actions_type"))
         session.execute(
-            text("CREATE INDEX IF NOT EXISTS idx_unsorted_actions_actor ON app.unsorted_file_actions(actor_user_id)")
+            text(
+                "CREATE INDEX IF NOT EXISTS idx_unsorted_actions_actor_recent "
+                "ON app.unsorted_file_actions(actor_user_id, unsorted_file_id, updated_at DESC) "
+                "INCLUDE (action_type, source_slug)"
+            )
         )
         session.execute(
-            text("CREATE INDEX IF NOT EXISTS idx_unsorted_actions_type ON app.unsorted_file_actions(action_type)")
+            text(
+                "CREATE INDEX IF NOT EXISTS idx_unsorted_actions_create_new_source "
+                "ON app.unsorted_file_actions(unsorted_file_id, updated_at DESC) "
+                "WHERE lower(action_type) = 'create_new_source'"
+            )
         )
         session.execute(
             text(
@@ -577,6 +593,10 @@ def _ensure_unsorted_db_once() -> None:
                 "ON app.unsorted_file_tag_proposals(proposer_user_id, unsorted_file_id)"
             )
         )
+        # The proposal upserts reset created_at, so it never tracked heap order there; nothing
+        # range-scans these tables by created_at either.
+        session.execute(text("DROP INDEX IF EXISTS app.idx_unsorted_push_proposals_created_at_brin"))
+        session.execute(text("DROP INDEX IF EXISTS app.idx_unsorted_tag_proposals_created_at_brin"))
         session.execute(
             text(
                 "CREATE INDEX IF NOT EXISTS idx_unsorted_tag_proposal_tags_proposal "
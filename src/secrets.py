@@ -1,6 +1,7 @@
 from __future__ import annotations
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from pathlib import Path
 from typing import Optional
@@ -65,3 +66,14 @@ def get_secret(name: str, default: Optional[str] = None) -> str:
     if default is not None:
         return default
     raise RuntimeError(f"Missing {name} (or {name}_RESOURCE)")
+
+
+def resolve_secrets(names: list[str], defaults: Optional[dict[str, str]] = None) -> dict[str, str]:
+    """
+    Resolve several secrets with `get_secret` semantics, fetching the Secret Manager
+    ones in parallel so startup pays one round trip instead of one per secret.
+    """
+    defaults = defaults or {}
+    with ThreadPoolExecutor(max_workers=max(1, len(names))) as pool:
+        futures = {name: pool.submit(get_secret, name, defaults.get(name)) for name in names}
+        return {name: future.result() for name, future in futures.items()}